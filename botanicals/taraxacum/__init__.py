@@ -7,6 +7,7 @@ scatters variant conversation seeds when context overflow approaches.
 Components:
 - seed_spreader: Extracts DNA and generates variant seeds on death
 - germinator: Selects and activates seeds on startup
+- seed_io: Seed bank file reading/writing (orjson when available)
 
 Usage:
     from botanicals.Taraxacum import seed_spreader, germinator
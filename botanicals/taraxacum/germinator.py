@@ -9,11 +9,22 @@ Selects which seeds to germinate on startup based on:
 Used at the start of a new conversation to continue from where we died.
 """
 
-import json
+import heapq
+import math
+import re
+from collections import OrderedDict, defaultdict
 from pathlib import Path
 from typing import List, Dict, Any
 import random
 
+import numpy as np
+
+from .seed_io import iter_batch_files, read_seed_batch, unpack_vector
+
+
+# Query/seed tokens: lowercase words longer than 3 characters
+_TOKEN_RE = re.compile(r"[a-z]{4,}")
+
 
 class TaraxacumGerminator:
     """
@@ -25,9 +36,22 @@ class TaraxacumGerminator:
     3. Activate selected seeds (inject into conversation context)
     """
     
-    def __init__(self, seed_bank_dir="data/taraxacum_seeds"):
+    # Memoized query -> best seed index entries kept per batch
+    _QUERY_CACHE_SIZE = 128
+    
+    def __init__(self, seed_bank_dir="data/taraxacum_seeds", embed_fn=None, rng_seed=None):
         self.seed_bank_dir = Path(seed_bank_dir)
+        
+        # Optional text -> vector function for embedding-based query alignment
+        self.embed_fn = embed_fn
+        
+        # Private RNG: no shared global state, reproducible when rng_seed is given
+        self._rng = random.Random(rng_seed)
         self.seed_bank_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Parsed seed batches per host: host_name -> (path, mtime, batch)
+        self._seed_cache = {}
+        
         print("[Taraxacum Germinator initialized]")
     
     def select_seed(self, 
@@ -62,9 +86,9 @@ class TaraxacumGerminator:
         
         # Selection strategy
         if prefer_phenotype:
-            selected = self._select_by_phenotype(seeds, prefer_phenotype)
+            selected = self._select_by_phenotype(seed_batch, prefer_phenotype)
         elif user_query:
-            selected = self._select_by_query_alignment(seeds, user_query)
+            selected = self._select_by_query_alignment(seed_batch, user_query)
         else:
             selected = self._select_by_viability(seeds)
         
@@ -74,59 +98,167 @@ class TaraxacumGerminator:
         return selected
     
     def _load_latest_seeds(self, host_name: str) -> Dict[str, Any]:
-        """Load most recent seed batch for this host"""
-        pattern = f"{host_name}_*.json"
-        seed_files = sorted(self.seed_bank_dir.glob(pattern), reverse=True)
+        """
+        Load most recent seed batch for this host
         
-        if not seed_files:
+        Parsed batches are cached per host and only re-read when the
+        newest seed file changes (different path or mtime).
+        """
+        entry = max(iter_batch_files(self.seed_bank_dir, host_name),
+                    key=lambda e: e.name, default=None)
+        
+        if entry is None:
+            self._seed_cache.pop(host_name, None)
             return None
         
-        with open(seed_files[0], 'r') as f:
-            return json.load(f)
+        newest = Path(entry.path)
+        mtime = entry.stat().st_mtime
+        
+        cached = self._seed_cache.get(host_name)
+        if cached and cached[0] == newest and cached[1] == mtime:
+            return cached[2]
+        
+        batch = read_seed_batch(newest)
+        
+        # Phenotype -> first seed with that phenotype, for O(1) preference lookup
+        phenotype_index = {}
+        for seed in batch.get("seeds", []):
+            phenotype_index.setdefault(seed.get("phenotype"), seed)
+        batch["_phenotype_index"] = phenotype_index
+        
+        self._seed_cache[host_name] = (newest, mtime, batch)
+        return batch
     
-    def _select_by_phenotype(self, seeds: List[Dict], preferred: str) -> Dict[str, Any]:
+    def _select_by_phenotype(self, seed_batch: Dict[str, Any], preferred: str) -> Dict[str, Any]:
         """Select seed with specific phenotype"""
-        for seed in seeds:
-            if seed.get("phenotype") == preferred:
-                return seed
+        seed = seed_batch["_phenotype_index"].get(preferred)
+        if seed:
+            return seed
         
         # Fallback to random if preferred not found
-        return random.choice(seeds)
+        return self._rng.choice(seed_batch["seeds"])
     
-    def _select_by_query_alignment(self, seeds: List[Dict], query: str) -> Dict[str, Any]:
+    def _build_query_index(self, seeds: List[Dict]) -> Dict[str, List[tuple]]:
         """
-        Select seed that best aligns with user query
+        Build inverted index: token -> [(seed_idx, weight), ...]
         
-        Simple keyword matching (could be enhanced with embeddings)
+        Theme tokens weigh 2, continuation prompt tokens weigh 1.
+        Seeds in a batch share their DNA, so each distinct theme list is
+        lowercased and tokenized once.
         """
-        query_lower = query.lower()
-        
-        # Score seeds based on keyword overlap
-        scored_seeds = []
-        for seed in seeds:
-            dna = seed.get("dna", {})
-            themes = " ".join(dna.get("themes", [])).lower()
-            prompt = seed.get("continuation_prompt", "").lower()
+        index = defaultdict(list)
+        theme_bags = {}
+        for idx, seed in enumerate(seeds):
+            themes = tuple(seed.get("dna", {}).get("themes", []))
+            theme_bag = theme_bags.get(themes)
+            if theme_bag is None:
+                theme_bag = set(_TOKEN_RE.findall(" ".join(themes).lower()))
+                theme_bags[themes] = theme_bag
             
-            # Simple overlap score
-            score = 0
-            for word in query_lower.split():
-                if len(word) > 3:  # Skip short words
-                    if word in themes:
-                        score += 2
-                    if word in prompt:
-                        score += 1
+            prompt = seed.get("continuation_prompt", "").lower()
             
-            scored_seeds.append((score, seed))
+            for token in theme_bag:
+                index[token].append((idx, 2))
+            for token in set(_TOKEN_RE.findall(prompt)):
+                index[token].append((idx, 1))
+        
+        return dict(index)
+    
+    def _embedding_matrix(self, seed_batch: Dict[str, Any]):
+        """
+        Stack seed embeddings into a (num_seeds, d) matrix, cached on the batch
         
-        # Sort by score
-        scored_seeds.sort(reverse=True, key=lambda x: x[0])
+        Returns None when any seed lacks an embedding.
+        """
+        if "_embedding_matrix" in seed_batch:
+            return seed_batch["_embedding_matrix"]
         
-        # If top score is > 0, use it; otherwise random
-        if scored_seeds[0][0] > 0:
-            return scored_seeds[0][1]
+        matrix = None
+        seeds = seed_batch.get("seeds", [])
+        if seeds and all("embedding" in s for s in seeds):
+            matrix = np.stack([unpack_vector(s["embedding"]) for s in seeds]).astype(np.float32)
+        
+        seed_batch["_embedding_matrix"] = matrix
+        return matrix
+    
+    def _select_by_query_alignment(self, seed_batch: Dict[str, Any], query: str) -> Dict[str, Any]:
+        """
+        Select seed that best aligns with user query
+        
+        Uses cosine similarity against stored seed embeddings when an
+        embedding function is available, otherwise keyword matching
+        through an inverted index built once per batch.
+        Best matches are memoized per batch, so repeated queries skip
+        embedding and scoring until the batch changes.
+        """
+        seeds = seed_batch.get("seeds", [])
+        
+        query_cache = seed_batch.setdefault("_query_cache", OrderedDict())
+        if query in query_cache:
+            query_cache.move_to_end(query)
+            best = query_cache[query]
         else:
-            return random.choice(seeds)
+            best = self._best_query_match(seed_batch, query)
+            query_cache[query] = best
+            if len(query_cache) > self._QUERY_CACHE_SIZE:
+                query_cache.popitem(last=False)
+        
+        # No seed aligned with the query - fall back to random
+        if best is None:
+            return self._rng.choice(seeds)
+        return seeds[best]
+    
+    def _best_query_match(self, seed_batch: Dict[str, Any], query: str):
+        """Index of the seed best aligned with query, or None if nothing matches"""
+        seeds = seed_batch.get("seeds", [])
+        
+        if self.embed_fn:
+            matrix = self._embedding_matrix(seed_batch)
+            if matrix is not None:
+                query_vec = np.asarray(self.embed_fn(query), dtype=np.float32)
+                norm = np.linalg.norm(query_vec)
+                if norm > 0 and query_vec.shape[0] == matrix.shape[1]:
+                    scores = matrix @ (query_vec / norm)
+                    return int(scores.argmax())
+        
+        index = seed_batch.get("_query_index")
+        if index is None:
+            index = self._build_query_index(seeds)
+            seed_batch["_query_index"] = index
+        
+        # Sum posting weights for every query token into a dense score array
+        scores = [0] * len(seeds)
+        matched = False
+        for token in _TOKEN_RE.findall(query.lower()):
+            postings = index.get(token)
+            if postings:
+                matched = True
+                for idx, weight in postings:
+                    scores[idx] += weight
+        
+        if not matched:
+            return None
+        
+        # Best score; max() keeps the earliest seed on ties
+        return max(range(len(seeds)), key=scores.__getitem__)
+    
+    def _weighted_sample(self, seeds: List[Dict], k: int) -> List[Dict]:
+        """
+        Draw k seeds without replacement, weighted by viability
+        
+        Efraimidis-Spirakis: key = log(u) / weight, keep the k largest keys.
+        Single pass, no cumulative sums or full sort.
+        """
+        keyed = []
+        for seed in seeds:
+            weight = seed.get("viability_score", 0.5)
+            if weight > 0:
+                key = math.log(1.0 - self._rng.random()) / weight
+            else:
+                key = -math.inf
+            keyed.append((key, seed))
+        
+        return [seed for _, seed in heapq.nlargest(k, keyed, key=lambda t: t[0])]
     
     def _select_by_viability(self, seeds: List[Dict]) -> Dict[str, Any]:
         """
@@ -135,23 +267,13 @@ class TaraxacumGerminator:
         Higher viability = more likely to germinate
         But keep some randomness for diversity
         """
-        # Weighted random selection based on viability
-        total_viability = sum(s.get("viability_score", 0.5) for s in seeds)
-        
-        if total_viability == 0:
-            return random.choice(seeds)
+        weights = [s.get("viability_score", 0.5) for s in seeds]
         
-        # Random number between 0 and total_viability
-        rand = random.uniform(0, total_viability)
+        if sum(weights) == 0:
+            return self._rng.choice(seeds)
         
-        # Select seed based on weighted random
-        cumulative = 0
-        for seed in seeds:
-            cumulative += seed.get("viability_score", 0.5)
-            if rand <= cumulative:
-                return seed
-        
-        return seeds[-1]  # Fallback
+        # Weighted random selection based on viability (C-level cumulative scan)
+        return self._rng.choices(seeds, weights=weights, k=1)[0]
     
     def germinate_seed(self, seed: Dict[str, Any]) -> str:
         """
@@ -171,21 +293,13 @@ class TaraxacumGerminator:
         insights = dna.get("insights", [])
         questions = dna.get("open_questions", [])
         
-        # Build germination context
-        context_parts = []
-        
-        if themes:
-            context_parts.append(f"Previous conversation themes: {', '.join(themes)}")
-        
-        if insights:
-            context_parts.append(f"Key insights from before: {'; '.join(insights[:2])}")
-        
-        if questions:
-            context_parts.append(f"Open questions: {'; '.join(questions[:2])}")
-        
-        context_parts.append(f"Continuation strategy ({phenotype}): {continuation}")
-        
-        germinated_context = "\n".join(context_parts)
+        # Build germination context (empty sections short-circuit to "")
+        germinated_context = "\n".join(filter(None, (
+            themes and f"Previous conversation themes: {', '.join(themes)}",
+            insights and f"Key insights from before: {'; '.join(insights[:2])}",
+            questions and f"Open questions: {'; '.join(questions[:2])}",
+            f"Continuation strategy ({phenotype}): {continuation}",
+        )))
         
         print(f"[🌱 Seed germinated - injecting context]")
         return germinated_context
@@ -226,10 +340,8 @@ class TaraxacumGerminator:
                     selected.append(seed)
                     used_phenotypes.add(phenotype)
         else:
-            # Just take top N by viability
-            selected = sorted(seeds, 
-                            key=lambda s: s.get("viability_score", 0.5), 
-                            reverse=True)[:count]
+            # Weighted draw of N seeds by viability
+            selected = self._weighted_sample(seeds, count)
         
         # Germinate each
         contexts = [self.germinate_seed(seed) for seed in selected]
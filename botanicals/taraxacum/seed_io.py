@@ -0,0 +1,148 @@
+"""
+Taraxacum Seed IO - Seed bank serialization
+
+Shared read/write helpers for the seed spreader and germinator.
+Uses orjson when installed, falls back to the stdlib json module.
+
+Numeric vectors (seed embeddings) are packed as base64 float16; seeds
+written as plain float lists are still readable.
+
+On-disk layout per batch:
+    <seed_id>.jsonl      one seed per line
+    <seed_id>.meta.json  seed_id / host / created
+
+Older batches stored as a single <seed_id>.json with a "seeds" list
+are still readable.
+"""
+
+import base64
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Iterator, List, Dict, Any
+
+import numpy as np
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+if ORJSON_AVAILABLE:
+    def _loads(data) -> Any:
+        return orjson.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+    def _dumps_line(obj) -> bytes:
+        return orjson.dumps(obj) + b"\n"
+else:
+    def _loads(data) -> Any:
+        return json.loads(data)
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+    def _dumps_line(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+
+# Below this size a plain read() is cheaper than setting up a mapping
+MMAP_THRESHOLD = 256 * 1024
+
+BATCH_SUFFIX = ".jsonl"
+META_SUFFIX = ".meta.json"
+LEGACY_SUFFIX = ".json"
+
+
+def read_seed_file(path: Path) -> Dict[str, Any]:
+    """
+    Read and parse a single JSON document
+    
+    Large files are memory-mapped so the parser sees one contiguous
+    buffer; small ones are read in a single call.
+    """
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            return _loads(f.read())
+        
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if not ORJSON_AVAILABLE:
+                return _loads(mm[:])
+            with memoryview(mm) as view:
+                return _loads(view)
+
+
+def write_seed_file(path: Path, data: Dict[str, Any]):
+    """Serialize a JSON document and write it in one call"""
+    with open(path, 'wb') as f:
+        f.write(_dumps(data))
+
+
+def meta_path_for(batch_path: Path) -> Path:
+    """Sidecar metadata path for a JSONL batch"""
+    return batch_path.with_name(batch_path.name[:-len(BATCH_SUFFIX)] + META_SUFFIX)
+
+
+def iter_batch_files(seed_bank_dir: Path, host_name: str = None) -> Iterator[os.DirEntry]:
+    """
+    Yield seed batch entries (JSONL and legacy JSON), skipping meta sidecars
+    
+    Single scandir pass filtered on entry names; DirEntry caches stat().
+    """
+    prefix = f"{host_name}_" if host_name else ""
+    with os.scandir(seed_bank_dir) as it:
+        for entry in it:
+            name = entry.name
+            if not name.startswith(prefix):
+                continue
+            if name.endswith(BATCH_SUFFIX):
+                yield entry
+            elif name.endswith(LEGACY_SUFFIX) and not name.endswith(META_SUFFIX):
+                yield entry
+
+
+def read_seed_batch(path: Path) -> Dict[str, Any]:
+    """
+    Load a seed batch as {"seed_id", "host", "created", "seeds": [...]}
+    
+    JSONL batches are parsed line by line; legacy JSON batches whole.
+    """
+    if not path.name.endswith(BATCH_SUFFIX):
+        return read_seed_file(path)
+    
+    meta_path = meta_path_for(path)
+    batch = read_seed_file(meta_path) if meta_path.exists() else {}
+    
+    seeds = []
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                seeds.append(_loads(line))
+    
+    batch["seeds"] = seeds
+    return batch
+
+
+def write_seed_batch(batch_path: Path, meta: Dict[str, Any], seeds: List[Dict[str, Any]]):
+    """Write the batch metadata sidecar and one JSONL line per seed"""
+    write_seed_file(meta_path_for(batch_path), meta)
+    with open(batch_path, 'wb') as f:
+        f.write(b"".join(_dumps_line(seed) for seed in seeds))
+
+
+def pack_vector(values) -> Any:
+    """Pack a float vector as base64 float16"""
+    return base64.b64encode(np.asarray(values, dtype=np.float16).tobytes()).decode("ascii")
+
+
+def unpack_vector(stored) -> Any:
+    """Inverse of pack_vector; also accepts a plain float list"""
+    if isinstance(stored, str):
+        return np.frombuffer(base64.b64decode(stored), dtype=np.float16)
+    return np.asarray(stored, dtype=np.float32)
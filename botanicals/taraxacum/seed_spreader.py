@@ -8,12 +8,20 @@ phenotypic expressions (conversation angles).
 Used by hosts/interns when context death approaches.
 """
 
-import json
+import bisect
+import concurrent.futures
+import heapq
+import re
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 import random
 
+from .seed_io import (
+    BATCH_SUFFIX, iter_batch_files, meta_path_for, pack_vector, read_seed_batch,
+    write_seed_batch
+)
+
 
 class TaraxacumSeedSpreader:
     """
@@ -25,8 +33,31 @@ class TaraxacumSeedSpreader:
     3. Store in seed bank for next germination
     """
     
-    def __init__(self, seed_bank_dir="data/taraxacum_seeds"):
+    # Sentences that look like insights (contain reasoning keywords)
+    _INSIGHT_RE = re.compile(r"because|therefore|means|discovered|realized", re.IGNORECASE)
+    
+    # Continuation prompt per phenotype, filled with the DNA themes
+    _PROMPT_TEMPLATES = {
+        "skeptical_inquiry": "Question the assumptions behind: {themes}",
+        "deep_dive_expansion": "Explore deeper into: {themes}",
+        "contrarian_angle": "Challenge the conventional view on: {themes}",
+        "synthesis_summary": "Synthesize multiple perspectives on: {themes}",
+        "unexplored_tangent": "Branch into related aspects of: {themes}",
+        "practical_application": "Find practical uses for insights about: {themes}",
+        "historical_context": "Connect {themes} to historical patterns",
+        "future_projection": "Project future implications of: {themes}",
+    }
+    _DEFAULT_PROMPT = "Continue discussing: {themes}"
+    
+    def __init__(self, seed_bank_dir="data/taraxacum_seeds", embed_fn=None, rng_seed=None):
         self.seed_bank_dir = Path(seed_bank_dir)
+        
+        # Optional text -> vector function; when set, seeds carry embeddings
+        # so the germinator can select them by cosine similarity
+        self.embed_fn = embed_fn
+        
+        # Private RNG: no shared global state, reproducible when rng_seed is given
+        self._rng = random.Random(rng_seed)
         self.seed_bank_dir.mkdir(parents=True, exist_ok=True)
         
         # Phenotype templates - different ways to continue the conversation
@@ -41,6 +72,9 @@ class TaraxacumSeedSpreader:
             "future_projection",      # Speculate on implications
         ]
         
+        # Parsed seed batches per host (None = any): host -> (path, mtime, batch)
+        self._seed_cache = {}
+        
         print("[Taraxacum Seed Spreader initialized]")
     
     def prepare_for_death(self, conversation_state: Dict[str, Any]) -> Dict[str, Any]:
@@ -60,14 +94,20 @@ class TaraxacumSeedSpreader:
         print("\n[🌼 TARAXACUM ACTIVATING - DEATH DETECTED]")
         print(f"[🧬 Extracting DNA from conversation...]")
         
+        # One clock read for the whole death event
+        now = datetime.now()
+        now_iso = now.isoformat()
+        timestamp = now.strftime("%Y%m%d_%H%M%S")
+        
         # Extract genetic material (core themes)
-        dna = self._extract_dna(conversation_state)
+        dna = self._extract_dna(conversation_state, now_iso)
         
         # Generate variant seeds
-        seeds = self._generate_seeds(dna)
+        seeds = self._generate_seeds(dna, now_iso)
         
         # Store in seed bank
-        seed_id = self._store_seeds(seeds, conversation_state.get("host_name", "unknown"))
+        seed_id = self._store_seeds(seeds, conversation_state.get("host_name", "unknown"),
+                                    now_iso, timestamp)
         
         print(f"[🌱 Generated {len(seeds)} seeds with ID: {seed_id}]")
         print(f"[✨ Seeds scattered - ready for next germination]")
@@ -76,10 +116,10 @@ class TaraxacumSeedSpreader:
             "seed_id": seed_id,
             "seed_count": len(seeds),
             "dna": dna,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso
         }
     
-    def _extract_dna(self, conversation_state: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_dna(self, conversation_state: Dict[str, Any], now_iso: str) -> Dict[str, Any]:
         """
         Extract genetic material from dying conversation
         
@@ -92,50 +132,58 @@ class TaraxacumSeedSpreader:
         recent_exchanges = conversation_state.get("recent_exchanges", [])
         themes = conversation_state.get("themes", [])
         
-        # Extract key topics from recent exchanges
-        topics = []
+        # Single pass over recent exchanges, stopping once both lists are full
         insights = []
         questions = []
         
         for exchange in recent_exchanges[-5:]:  # Last 5 exchanges
             message = exchange.get("message", "")
             
-            # Simple extraction (could be enhanced with NLP)
-            if "?" in message:
-                questions.append(message.split("?")[0] + "?")
+            # Simple extraction (could be enhanced with NLP):
+            # first question sentence = last sentence break before the first "?"
+            if len(questions) < 3:
+                qm = message.find("?")
+                if qm >= 0:
+                    start = max(message.rfind(".", 0, qm), message.rfind("!", 0, qm)) + 1
+                    questions.append(message[start:qm + 1].strip())
             
-            # Extract sentences that look like insights (contain keywords)
-            insight_keywords = ["because", "therefore", "means", "discovered", "realized"]
-            if any(kw in message.lower() for kw in insight_keywords):
+            # Extract messages that look like insights (contain keywords)
+            if len(insights) < 3 and self._INSIGHT_RE.search(message):
                 insights.append(message[:200])  # First 200 chars
+            
+            if len(questions) == 3 and len(insights) == 3:
+                break
         
         dna = {
             "themes": themes if themes else ["general discussion"],
-            "insights": insights[:3],  # Top 3 insights
-            "open_questions": questions[:3],  # Top 3 questions
+            "insights": insights,  # Top 3 insights
+            "open_questions": questions,  # Top 3 questions
             "energy_level": self._estimate_energy(recent_exchanges),
             "conversation_depth": len(recent_exchanges),
-            "extraction_timestamp": datetime.now().isoformat()
+            "extraction_timestamp": now_iso
         }
         
         return dna
     
+    # Average message length thresholds -> energy level
+    _ENERGY_THRESHOLDS = (200, 500)
+    _ENERGY_LEVELS = ("calm", "medium", "high")
+    
     def _estimate_energy(self, exchanges: List[Dict]) -> str:
         """Estimate conversation energy level"""
         if not exchanges:
             return "calm"
         
-        recent_lengths = [len(ex.get("message", "")) for ex in exchanges[-3:]]
-        avg_length = sum(recent_lengths) / len(recent_lengths) if recent_lengths else 0
+        total = 0
+        count = 0
+        for ex in exchanges[-3:]:
+            total += len(ex.get("message", ""))
+            count += 1
+        avg_length = total / count
         
-        if avg_length > 500:
-            return "high"
-        elif avg_length > 200:
-            return "medium"
-        else:
-            return "calm"
+        return self._ENERGY_LEVELS[bisect.bisect_left(self._ENERGY_THRESHOLDS, avg_length)]
     
-    def _generate_seeds(self, dna: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _generate_seeds(self, dna: Dict[str, Any], now_iso: str) -> List[Dict[str, Any]]:
         """
         Generate variant seeds from DNA
         
@@ -143,62 +191,64 @@ class TaraxacumSeedSpreader:
         (different way to continue the conversation)
         """
         seeds = []
+        themes = ", ".join(dna.get("themes", []))
         
         # Generate 5-8 variant seeds
-        num_seeds = random.randint(5, 8)
-        selected_phenotypes = random.sample(self.phenotypes, min(num_seeds, len(self.phenotypes)))
+        num_seeds = self._rng.randint(5, 8)
+        selected_phenotypes = self._rng.sample(self.phenotypes, min(num_seeds, len(self.phenotypes)))
         
         for phenotype in selected_phenotypes:
             seed = {
                 "phenotype": phenotype,
                 "dna": dna,
-                "continuation_prompt": self._create_continuation_prompt(phenotype, dna),
-                "viability_score": random.uniform(0.7, 1.0),  # All seeds viable
-                "created": datetime.now().isoformat()
+                "continuation_prompt": self._create_continuation_prompt(phenotype, themes),
+                "viability_score": self._rng.uniform(0.7, 1.0),  # All seeds viable
+                "created": now_iso
             }
+            if self.embed_fn:
+                seed["embedding"] = self._embed_seed(seed)
             seeds.append(seed)
         
         return seeds
     
-    def _create_continuation_prompt(self, phenotype: str, dna: Dict[str, Any]) -> str:
+    def _embed_seed(self, seed: Dict[str, Any]) -> Any:
+        """Unit-length embedding of a seed's continuation prompt + themes, packed"""
+        text = seed["continuation_prompt"] + " " + " ".join(seed["dna"].get("themes", []))
+        vector = [float(x) for x in self.embed_fn(text)]
+        norm = sum(x * x for x in vector) ** 0.5
+        if norm > 0:
+            vector = [x / norm for x in vector]
+        return pack_vector(vector)
+    
+    def _create_continuation_prompt(self, phenotype: str, themes: str) -> str:
         """
-        Create a continuation prompt based on phenotype and DNA
+        Create a continuation prompt based on phenotype and DNA themes
         
         This prompt can be used to seed the next conversation
         """
-        themes = ", ".join(dna.get("themes", []))
-        
-        prompts = {
-            "skeptical_inquiry": f"Question the assumptions behind: {themes}",
-            "deep_dive_expansion": f"Explore deeper into: {themes}",
-            "contrarian_angle": f"Challenge the conventional view on: {themes}",
-            "synthesis_summary": f"Synthesize multiple perspectives on: {themes}",
-            "unexplored_tangent": f"Branch into related aspects of: {themes}",
-            "practical_application": f"Find practical uses for insights about: {themes}",
-            "historical_context": f"Connect {themes} to historical patterns",
-            "future_projection": f"Project future implications of: {themes}",
-        }
-        
-        return prompts.get(phenotype, f"Continue discussing: {themes}")
+        template = self._PROMPT_TEMPLATES.get(phenotype, self._DEFAULT_PROMPT)
+        return template.format(themes=themes)
     
-    def _store_seeds(self, seeds: List[Dict], host_name: str) -> str:
+    def _store_seeds(self, seeds: List[Dict], host_name: str,
+                     now_iso: str, timestamp: str) -> str:
         """
         Store seeds in the seed bank
         
         Returns seed_id for retrieval
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         seed_id = f"{host_name}_{timestamp}"
         
-        seed_file = self.seed_bank_dir / f"{seed_id}.json"
+        seed_file = self.seed_bank_dir / f"{seed_id}{BATCH_SUFFIX}"
+        
+        write_seed_batch(seed_file, {
+            "seed_id": seed_id,
+            "host": host_name,
+            "created": now_iso
+        }, seeds)
         
-        with open(seed_file, 'w') as f:
-            json.dump({
-                "seed_id": seed_id,
-                "host": host_name,
-                "seeds": seeds,
-                "created": datetime.now().isoformat()
-            }, f, indent=2)
+        # A new batch supersedes whatever was cached for this host
+        self._seed_cache.pop(host_name, None)
+        self._seed_cache.pop(None, None)
         
         return seed_id
     
@@ -208,20 +258,27 @@ class TaraxacumSeedSpreader:
         
         Used by germinator on startup
         """
-        # Find all seed files
-        if host_name:
-            pattern = f"{host_name}_*.json"
-        else:
-            pattern = "*.json"
+        # Find newest seed file (all hosts if host_name is None)
+        entry = max(iter_batch_files(self.seed_bank_dir, host_name),
+                    key=lambda e: e.name, default=None)
         
-        seed_files = sorted(self.seed_bank_dir.glob(pattern), reverse=True)
-        
-        if not seed_files:
+        if entry is None:
+            self._seed_cache.pop(host_name, None)
             return None
         
+        # Reuse the parsed batch if the newest file hasn't changed
+        newest = Path(entry.path)
+        mtime = entry.stat().st_mtime
+        
+        cached = self._seed_cache.get(host_name)
+        if cached and cached[0] == newest and cached[1] == mtime:
+            return cached[2]
+        
         # Load most recent
-        with open(seed_files[0], 'r') as f:
-            return json.load(f)
+        batch = read_seed_batch(newest)
+        
+        self._seed_cache[host_name] = (newest, mtime, batch)
+        return batch
     
     def clear_old_seeds(self, keep_recent=5):
         """
@@ -229,9 +286,21 @@ class TaraxacumSeedSpreader:
         
         Prevents seed bank from growing infinitely
         """
-        seed_files = sorted(self.seed_bank_dir.glob("*.json"), reverse=True)
+        seed_files = [Path(e.path) for e in iter_batch_files(self.seed_bank_dir)]
+        keep = set(heapq.nlargest(keep_recent, seed_files, key=lambda p: p.name))
+        
+        # Remove all but the most recent (unlinks overlap on a small pool)
+        old_seeds = [p for p in seed_files if p not in keep]
+        if old_seeds:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(self._remove_batch, old_seeds))
+            print(f"[🗑️  Removed {len(old_seeds)} old seed batches]")
         
-        # Remove all but the most recent
-        for old_seed in seed_files[keep_recent:]:
-            old_seed.unlink()
-            print(f"[🗑️  Removed old seed batch: {old_seed.name}]")
+        self._seed_cache.clear()
+    
+    @staticmethod
+    def _remove_batch(batch_path: Path):
+        """Delete a seed batch file and its metadata sidecar"""
+        batch_path.unlink(missing_ok=True)
+        if batch_path.name.endswith(BATCH_SUFFIX):
+            meta_path_for(batch_path).unlink(missing_ok=True)
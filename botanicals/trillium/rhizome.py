@@ -12,12 +12,40 @@ The rhizome stores:
 Used by hosts/interns during healthy conversation flow to build lasting memory.
 """
 
+import atexit
+import concurrent.futures
+import functools
+import heapq
+import itertools
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any
 from collections import defaultdict
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+
+# Connection keys are "key1<US>key2" with the pair sorted (US = ASCII unit separator)
+_CONN_SEP = "\x1f"
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_theme(theme: str) -> str:
+    """Normalize theme for consistent keys (memoized - themes recur constantly)"""
+    return theme.lower().strip().replace(" ", "_")
+
 
 class TrilliumRhizome:
     """
@@ -32,38 +60,265 @@ class TrilliumRhizome:
     4. Persists across conversation restarts
     """
     
-    def __init__(self, rhizome_dir="data/trillium_rhizome"):
+    # Fold the delta log into a fresh snapshot once it grows past this many lines
+    COMPACT_EVERY = 500
+    
+    # Shared single worker for non-blocking context retrieval (created on first use)
+    _context_executor = None
+    
+    def __init__(self, rhizome_dir="data/trillium_rhizome", pretty=False, save_interval=30.0,
+                 verbose=False):
         self.rhizome_dir = Path(rhizome_dir)
         self.rhizome_dir.mkdir(parents=True, exist_ok=True)
         
+        # Per-theme / per-call detail output (hot path); summaries always print
+        self.verbose = verbose
+        
+        # Debug: write indented JSON snapshots (compact by default; see dump_pretty())
+        self.pretty = pretty
+        
+        # Storage: snapshot + rhizome.log of appended node/connection upserts
+        # since that snapshot (replayed on load, folded in by compact()).
+        # Snapshot is binary rhizome.mp with msgpack installed, else rhizome.json
+        self.json_file = self.rhizome_dir / "rhizome.json"
+        self.rhizome_file = self.rhizome_dir / "rhizome.mp" if MSGPACK_AVAILABLE else self.json_file
+        self.log_file = self.rhizome_dir / "rhizome.log"
+        self._log_lines = 0
+        
         # Load existing rhizome or create new
-        self.rhizome_file = self.rhizome_dir / "rhizome.json"
         self.rhizome = self._load_rhizome()
         
+        # Adjacency index over connections: theme_key -> {neighbor_key: strength}
+        # (in-memory only, rebuilt from connections on load)
+        self._neighbors = self._build_neighbors(self.rhizome["connections"])
+        
+        # Per-node insight sets for O(1) dedup (in-memory only, rebuilt on load)
+        self._insight_sets = {key: set(node.get("insights", []))
+                              for key, node in self.rhizome["nodes"].items()}
+        
+        # Write-behind persistence: mutations mark the rhizome dirty and it is
+        # written at most once per save_interval seconds, at the end of a
+        # `with rhizome:` block, on flush(), or at interpreter exit
+        self.save_interval = save_interval
+        self._dirty = False
+        self._dirty_nodes = set()
+        self._dirty_connections = set()
+        self._needs_snapshot = False
+        self._last_save = time.monotonic()
+        self._batch_depth = 0
+        atexit.register(self.flush)
+        
         print(f"[Trillium Rhizome initialized - {len(self.rhizome.get('nodes', {}))} wisdom nodes]")
     
     def _load_rhizome(self) -> Dict[str, Any]:
-        """Load existing rhizome or create new"""
+        """Load existing rhizome (snapshot + delta log) or create new"""
+        migrate = False
         if self.rhizome_file.exists():
-            with open(self.rhizome_file, 'r') as f:
-                rhizome = json.load(f)
-                print(f"[🌿 Loaded existing rhizome from {self.rhizome_file}]")
-                return rhizome
+            rhizome = self._load_snapshot(self.rhizome_file)
+            print(f"[🌿 Loaded existing rhizome from {self.rhizome_file}]")
+        elif self.json_file.exists():
+            # JSON snapshot from before msgpack was available - convert once
+            rhizome = self._load_snapshot(self.json_file)
+            migrate = True
+            print(f"[🌿 Migrating rhizome from {self.json_file} to {self.rhizome_file}]")
         else:
             print("[🌱 Creating new rhizome]")
-            return {
+            rhizome = {
                 "nodes": {},  # Theme nodes
                 "connections": {},  # Theme interconnections
                 "created": datetime.now().isoformat(),
                 "last_updated": datetime.now().isoformat()
             }
+        
+        self._replay_log(rhizome)
+        self._migrate_connection_keys(rhizome)
+        
+        if migrate:
+            self.rhizome_file.write_bytes(self._pack(rhizome))
+            self.log_file.unlink(missing_ok=True)
+            self._log_lines = 0
+        return rhizome
+    
+    def _load_snapshot(self, snapshot_file: Path) -> Dict[str, Any]:
+        """Parse a msgpack or JSON snapshot"""
+        data = snapshot_file.read_bytes()
+        if snapshot_file.suffix == ".mp":
+            return msgpack.unpackb(data, raw=False)
+        return self._loads(data)
+    
+    @staticmethod
+    def _migrate_connection_keys(rhizome: Dict[str, Any]):
+        """Rekey legacy str(tuple) connections (with a "themes" list) to a<US>b keys"""
+        connections = rhizome["connections"]
+        if not any("themes" in conn for conn in connections.values()):
+            return
+        
+        migrated = {}
+        for conn_key, conn_data in connections.items():
+            if "themes" in conn_data:
+                conn_data = dict(conn_data)
+                conn_key = _CONN_SEP.join(sorted(conn_data.pop("themes")))
+            migrated[conn_key] = conn_data
+        rhizome["connections"] = migrated
+    
+    def _replay_log(self, rhizome: Dict[str, Any]):
+        """Apply upserts appended to the delta log since the last snapshot"""
+        if not self.log_file.exists():
+            return
+        
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = self._loads(line)
+                except ValueError:
+                    break  # Torn final line from an interrupted append
+                
+                op = entry.get("op")
+                if op == "node":
+                    rhizome["nodes"][entry["key"]] = entry["node"]
+                elif op == "conn":
+                    rhizome["connections"][entry["key"]] = entry["conn"]
+                elif op == "touch":
+                    rhizome["last_updated"] = entry["last_updated"]
+                self._log_lines += 1
+    
+    def _log(self, message: str):
+        """Print detail output only when verbose"""
+        if self.verbose:
+            print(message)
+    
+    def __enter__(self):
+        self._batch_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.flush()
+        return False
+    
+    @staticmethod
+    def _build_neighbors(connections: Dict[str, Any]) -> Dict[str, Dict[str, int]]:
+        """Build theme_key -> {neighbor_key: strength} from the connection dict"""
+        neighbors = defaultdict(dict)
+        for conn_key, conn_data in connections.items():
+            key1, key2 = conn_key.split(_CONN_SEP)
+            if key1 == key2:
+                continue
+            neighbors[key1][key2] = conn_data["strength"]
+            neighbors[key2][key1] = conn_data["strength"]
+        return neighbors
+    
+    def _mark_dirty(self, nodes=(), connections=(), snapshot=False):
+        """
+        Record a mutation; persist now only if the debounce window has passed
+        
+        Args:
+            nodes / connections: keys whose state changed (appended to the log)
+            snapshot: True for bulk changes that need a full rewrite
+        """
+        self._dirty = True
+        self._dirty_nodes.update(nodes)
+        self._dirty_connections.update(connections)
+        self._needs_snapshot = self._needs_snapshot or snapshot
+        if self._batch_depth == 0 and time.monotonic() - self._last_save >= self.save_interval:
+            self.flush()
+    
+    def flush(self):
+        """Write pending changes to disk (no-op when nothing changed)"""
+        if not self._dirty:
+            return
+        
+        # Deltas need a base snapshot; bulk changes and long logs get a fresh one
+        pending = len(self._dirty_nodes) + len(self._dirty_connections)
+        if (self._needs_snapshot
+                or self._log_lines + pending >= self.COMPACT_EVERY
+                or not self.rhizome_file.exists()):
+            self.compact()
+        else:
+            self._append_log()
+        
+        self._dirty = False
+        self._last_save = time.monotonic()
+    
+    def _append_log(self):
+        """Append one upsert line per changed node/connection - O(changes), not O(rhizome)"""
+        now_iso = datetime.now().isoformat()
+        self.rhizome["last_updated"] = now_iso
+        
+        nodes = self.rhizome["nodes"]
+        connections = self.rhizome["connections"]
+        entries = [{"op": "node", "key": key, "node": nodes[key]}
+                   for key in self._dirty_nodes if key in nodes]
+        entries += [{"op": "conn", "key": key, "conn": connections[key]}
+                    for key in self._dirty_connections if key in connections]
+        entries.append({"op": "touch", "last_updated": now_iso})
+        
+        with open(self.log_file, 'ab') as f:
+            f.write(b"".join(self._encode_line(entry) for entry in entries))
+        
+        self._log_lines += len(entries)
+        self._dirty_nodes.clear()
+        self._dirty_connections.clear()
+    
+    def compact(self):
+        """Write a full snapshot and drop the delta log it supersedes"""
+        self._save_rhizome()
+        self.log_file.unlink(missing_ok=True)
+        self._log_lines = 0
+        self._dirty_nodes.clear()
+        self._dirty_connections.clear()
+        self._needs_snapshot = False
+    
+    @staticmethod
+    def _loads(data: bytes) -> Any:
+        """Parse a JSON document from one in-memory buffer"""
+        if ORJSON_AVAILABLE:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    @staticmethod
+    def _encode_line(entry: Dict[str, Any]) -> bytes:
+        """One compact JSON line for the delta log"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(entry) + b"\n"
+        return json.dumps(entry, separators=(",", ":")).encode() + b"\n"
     
     def _save_rhizome(self):
         """Persist rhizome to disk"""
         self.rhizome["last_updated"] = datetime.now().isoformat()
         
-        with open(self.rhizome_file, 'w') as f:
-            json.dump(self.rhizome, f, indent=2)
+        # Serialize fully in memory, then one write
+        self.rhizome_file.write_bytes(self._pack(self.rhizome))
+    
+    def _pack(self, rhizome: Dict[str, Any]) -> bytes:
+        """Snapshot bytes: msgpack for rhizome.mp, JSON (compact unless pretty) otherwise"""
+        if self.rhizome_file.suffix == ".mp":
+            return msgpack.packb(rhizome)
+        return self._dumps(rhizome, self.pretty)
+    
+    @staticmethod
+    def _dumps(obj: Any, pretty: bool = False) -> bytes:
+        """Serialize to JSON bytes - compact for storage, indented for humans"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+        if pretty:
+            return json.dumps(obj, indent=2).encode()
+        return json.dumps(obj, separators=(",", ":")).encode()
+    
+    def dump_pretty(self, path=None) -> str:
+        """
+        Human-readable (indented) JSON of the current rhizome
+        
+        Writes it to `path` when given; the on-disk snapshot stays compact
+        (or binary). Use this to export a msgpack rhizome for inspection.
+        """
+        text = self._dumps(self.rhizome, pretty=True).decode()
+        if path is not None:
+            Path(path).write_text(text, encoding="utf-8")
+        return text
     
     def deepen_roots(self, themes: List[str], insights: List[str] = None):
         """
@@ -75,73 +330,97 @@ class TrilliumRhizome:
         
         This is called periodically during conversation, not on death.
         """
-        print(f"\n[🌿 TRILLIUM DEEPENING - Adding to rhizome]")
+        self._log(f"\n[🌿 TRILLIUM DEEPENING - Adding to rhizome]")
+        
+        # One timestamp for every node/connection created in this call
+        now_iso = datetime.now().isoformat()
         
+        nodes = self.rhizome["nodes"]
+        touched_nodes = []
+        new_count = 0
+        insight_count = 0
         for theme in themes:
             theme_key = self._normalize_theme(theme)
+            touched_nodes.append(theme_key)
             
-            # Create or update theme node
-            if theme_key not in self.rhizome["nodes"]:
-                self.rhizome["nodes"][theme_key] = {
+            # Create or update theme node (one lookup, then mutate in place)
+            node = nodes.get(theme_key)
+            if node is None:
+                node = nodes[theme_key] = {
                     "theme": theme,
-                    "first_seen": datetime.now().isoformat(),
+                    "first_seen": now_iso,
                     "occurrences": 1,
                     "insights": [],
                     "energy": 1.0
                 }
-                print(f"[🌱 New theme node: {theme}]")
+                new_count += 1
+                self._log(f"[🌱 New theme node: {theme}]")
             else:
-                self.rhizome["nodes"][theme_key]["occurrences"] += 1
+                node["occurrences"] += 1
                 # Increase energy (capped at 10)
-                current_energy = self.rhizome["nodes"][theme_key].get("energy", 1.0)
-                self.rhizome["nodes"][theme_key]["energy"] = min(current_energy + 0.5, 10.0)
-                print(f"[⚡ Theme '{theme}' energy: {self.rhizome['nodes'][theme_key]['energy']:.1f}]")
+                node["energy"] = min(node.get("energy", 1.0) + 0.5, 10.0)
+                self._log(f"[⚡ Theme '{theme}' energy: {node['energy']:.1f}]")
             
             # Add insights to this theme
             if insights:
+                node_insights = node["insights"]
+                seen = self._insight_sets.setdefault(theme_key, set(node_insights))
                 for insight in insights:
-                    if insight not in self.rhizome["nodes"][theme_key]["insights"]:
-                        self.rhizome["nodes"][theme_key]["insights"].append(insight)
-                        print(f"[💡 Added insight to '{theme}']")
+                    if insight not in seen:
+                        seen.add(insight)
+                        node_insights.append(insight)
+                        insight_count += 1
+                        self._log(f"[💡 Added insight to '{theme}']")
         
         # Update connections between themes (co-occurrence)
-        self._update_connections(themes)
+        touched_connections = self._update_connections(themes, now_iso)
         
-        # Persist
-        self._save_rhizome()
+        # Persist (debounced, appended to the delta log)
+        self._mark_dirty(nodes=touched_nodes, connections=touched_connections)
         
-        print(f"[✨ Rhizome deepened - now {len(self.rhizome['nodes'])} theme nodes]")
+        print(f"[✨ Rhizome deepened - {new_count} new, {len(themes) - new_count} updated themes, "
+              f"{insight_count} insights, {len(touched_connections)} connections - "
+              f"now {len(self.rhizome['nodes'])} theme nodes]")
     
     def _normalize_theme(self, theme: str) -> str:
         """Normalize theme for consistent keys"""
-        return theme.lower().strip().replace(" ", "_")
+        return _normalize_theme(theme)
     
-    def _update_connections(self, themes: List[str]):
+    def _update_connections(self, themes: List[str], now_iso: str = None):
         """
         Update co-occurrence connections between themes
         
-        Themes discussed together are connected in the rhizome
+        Themes discussed together are connected in the rhizome.
+        Returns the connection keys that changed.
         """
+        touched = []
         if len(themes) < 2:
-            return
+            return touched
         
-        # Create connections between all pairs
-        for i, theme1 in enumerate(themes):
-            for theme2 in themes[i+1:]:
-                key1 = self._normalize_theme(theme1)
-                key2 = self._normalize_theme(theme2)
-                
-                # Create sorted connection key
-                conn_key = tuple(sorted([key1, key2]))
-                
-                if conn_key not in self.rhizome["connections"]:
-                    self.rhizome["connections"][str(conn_key)] = {
-                        "themes": list(conn_key),
-                        "strength": 1,
-                        "created": datetime.now().isoformat()
-                    }
-                else:
-                    self.rhizome["connections"][str(conn_key)]["strength"] += 1
+        connections = self.rhizome["connections"]
+        if now_iso is None:
+            now_iso = datetime.now().isoformat()
+        
+        # Normalize once; sorted unique keys give each pair in canonical order
+        keys = sorted({_normalize_theme(theme) for theme in themes})
+        for key1, key2 in itertools.combinations(keys, 2):
+            conn_key = key1 + _CONN_SEP + key2
+            
+            conn = connections.get(conn_key)
+            if conn is None:
+                conn = connections[conn_key] = {
+                    "strength": 1,
+                    "created": now_iso
+                }
+            else:
+                conn["strength"] += 1
+            touched.append(conn_key)
+            
+            # Mirror into the adjacency index
+            self._neighbors[key1][key2] = conn["strength"]
+            self._neighbors[key2][key1] = conn["strength"]
+        
+        return touched
     
     def get_deep_context(self, current_themes: List[str], max_depth: int = 3) -> Dict[str, Any]:
         """
@@ -152,7 +431,7 @@ class TrilliumRhizome:
         if not current_themes:
             return {"themes": [], "insights": [], "connections": []}
         
-        print(f"\n[🌿 TRILLIUM RETRIEVING - Deep context for: {current_themes}]")
+        self._log(f"\n[🌿 TRILLIUM RETRIEVING - Deep context for: {current_themes}]")
         
         relevant_nodes = []
         all_insights = []
@@ -170,41 +449,60 @@ class TrilliumRhizome:
                 })
                 all_insights.extend(node.get("insights", []))
         
-        # Find connected themes (one hop away)
+        # Find connected themes (one hop away) via the adjacency index
         for theme in current_themes:
             theme_key = self._normalize_theme(theme)
             
-            for conn_str, conn_data in self.rhizome["connections"].items():
-                conn_themes = conn_data["themes"]
-                
-                if theme_key in conn_themes:
-                    # Found a connection
-                    other_theme = [t for t in conn_themes if t != theme_key][0]
-                    
-                    if other_theme in self.rhizome["nodes"]:
-                        node = self.rhizome["nodes"][other_theme]
-                        relevant_connections.append({
-                            "theme": node["theme"],
-                            "connection_strength": conn_data["strength"],
-                            "energy": node.get("energy", 1.0)
-                        })
-                        all_insights.extend(node.get("insights", [])[:2])  # Add top 2 insights
-        
-        # Sort by energy
-        relevant_nodes.sort(key=lambda x: x["energy"], reverse=True)
-        relevant_connections.sort(key=lambda x: x["connection_strength"], reverse=True)
-        
+            # Snapshot the neighbor items - a background lookup may race deepen_roots
+            for other_theme, strength in list(self._neighbors.get(theme_key, {}).items()):
+                if other_theme in self.rhizome["nodes"]:
+                    node = self.rhizome["nodes"][other_theme]
+                    relevant_connections.append({
+                        "theme": node["theme"],
+                        "connection_strength": strength,
+                        "energy": node.get("energy", 1.0)
+                    })
+                    all_insights.extend(node.get("insights", [])[:2])  # Add top 2 insights
+        
+        # Top 3 by energy / connection strength
         context = {
-            "direct_themes": relevant_nodes[:3],
-            "connected_themes": relevant_connections[:3],
+            "direct_themes": heapq.nlargest(3, relevant_nodes, key=lambda x: x["energy"]),
+            "connected_themes": heapq.nlargest(3, relevant_connections,
+                                               key=lambda x: x["connection_strength"]),
             "accumulated_insights": all_insights[:5],  # Top 5 insights
             "rhizome_depth": len(self.rhizome["nodes"])
         }
         
-        print(f"[✨ Retrieved {len(relevant_nodes)} direct themes, {len(relevant_connections)} connections]")
+        self._log(f"[✨ Retrieved {len(relevant_nodes)} direct themes, {len(relevant_connections)} connections]")
         
         return context
     
+    def get_deep_context_async(self, current_themes: List[str], max_depth: int = 3) -> concurrent.futures.Future:
+        """
+        Start get_deep_context on a background worker and return its Future
+        
+        Lets interactive callers keep going and collect the context later
+        (or give up on it) instead of blocking on the traversal.
+        """
+        if TrilliumRhizome._context_executor is None:
+            TrilliumRhizome._context_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="trillium-context")
+        return TrilliumRhizome._context_executor.submit(self.get_deep_context, current_themes, max_depth)
+    
+    def get_deep_context_within(self, current_themes: List[str], timeout: float,
+                                max_depth: int = 3) -> Dict[str, Any]:
+        """
+        Opportunistic get_deep_context: wait at most `timeout` seconds
+        
+        Returns an empty context if the traversal has not finished in time.
+        """
+        future = self.get_deep_context_async(current_themes, max_depth)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            print(f"[⏱️  Trillium context not ready within {timeout}s - continuing without it]")
+            return {"themes": [], "insights": [], "connections": []}
+    
     def get_strongest_themes(self, top_n: int = 5) -> List[Dict[str, Any]]:
         """
         Get the strongest (most energetic) themes in the rhizome
@@ -214,15 +512,15 @@ class TrilliumRhizome:
         if not self.rhizome["nodes"]:
             return []
         
-        # Sort by energy
-        sorted_nodes = sorted(
+        # Top N by energy (partial heap, no full sort)
+        top_nodes = heapq.nlargest(
+            top_n,
             self.rhizome["nodes"].items(),
-            key=lambda x: x[1].get("energy", 0),
-            reverse=True
+            key=lambda x: x[1].get("energy", 0)
         )
         
         strongest = []
-        for theme_key, node in sorted_nodes[:top_n]:
+        for theme_key, node in top_nodes:
             strongest.append({
                 "theme": node["theme"],
                 "energy": node.get("energy", 1.0),
@@ -239,7 +537,7 @@ class TrilliumRhizome:
         Themes not discussed recently lose energy.
         Call this periodically (e.g., once per conversation).
         """
-        print("\n[🍂 TRILLIUM DECAY - Natural energy reduction]")
+        self._log("\n[🍂 TRILLIUM DECAY - Natural energy reduction]")
         
         for theme_key, node in self.rhizome["nodes"].items():
             old_energy = node.get("energy", 1.0)
@@ -249,9 +547,9 @@ class TrilliumRhizome:
             node["energy"] = max(new_energy, 0.1)
             
             if old_energy > 1.0 and new_energy < 1.0:
-                print(f"[🍂 Theme '{node['theme']}' energy decayed below 1.0]")
+                self._log(f"[🍂 Theme '{node['theme']}' energy decayed below 1.0]")
         
-        self._save_rhizome()
+        self._mark_dirty(snapshot=True)
     
     def prune_weak_themes(self, min_energy: float = 0.2):
         """
@@ -259,19 +557,33 @@ class TrilliumRhizome:
         
         Only call this occasionally (e.g., every 10 conversations)
         """
-        print("\n[✂️  TRILLIUM PRUNING - Removing weak themes]")
+        self._log("\n[✂️  TRILLIUM PRUNING - Removing weak themes]")
         
-        to_remove = []
-        for theme_key, node in self.rhizome["nodes"].items():
-            if node.get("energy", 1.0) < min_energy:
-                to_remove.append(theme_key)
+        nodes = self.rhizome["nodes"]
+        to_remove = [theme_key for theme_key, node in nodes.items()
+                     if node.get("energy", 1.0) < min_energy]
         
         for theme_key in to_remove:
-            del self.rhizome["nodes"][theme_key]
-            print(f"[✂️  Pruned weak theme: {self.rhizome['nodes'].get(theme_key, {}).get('theme', theme_key)}]")
+            name = nodes.pop(theme_key)["theme"]
+            self._insight_sets.pop(theme_key, None)
+            self._log(f"[✂️  Pruned weak theme: {name}]")
         
         if to_remove:
-            self._save_rhizome()
+            pruned = set(to_remove)
+            
+            # Drop edges touching a pruned node in one pass (no dangling connections)
+            self.rhizome["connections"] = {
+                conn_key: conn_data
+                for conn_key, conn_data in self.rhizome["connections"].items()
+                if pruned.isdisjoint(conn_key.split(_CONN_SEP))
+            }
+            
+            # Mirror into the adjacency index
+            for theme_key in pruned:
+                for neighbor in self._neighbors.pop(theme_key, {}):
+                    self._neighbors.get(neighbor, {}).pop(theme_key, None)
+            
+            self._mark_dirty(snapshot=True)
             print(f"[✨ Pruned {len(to_remove)} weak themes]")
     
     def get_rhizome_summary(self) -> str:
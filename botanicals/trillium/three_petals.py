@@ -11,10 +11,30 @@ Petal 3: FUTURE - Where we're heading (anticipated themes)
 Used to maintain balanced understanding and avoid one-sided thinking.
 """
 
+import functools
+import re
 from typing import List, Dict, Any
 from datetime import datetime
 
 
+def _indicator_re(indicators: List[str]):
+    """One substring search for any of the indicators (matched anywhere, like `in`)"""
+    return re.compile("|".join(map(re.escape, indicators)))
+
+
+# Direction indicator vocabularies, searched in lowercased text
+_PAST_RE = _indicator_re(["before", "earlier", "previously", "we discussed"])
+_PRESENT_RE = _indicator_re(["now", "currently", "research shows", "facts"])
+_FUTURE_RE = _indicator_re(["next", "could", "might", "let's"])
+_NEXT_RE = _indicator_re(["next", "then", "could", "might", "let's", "what if"])
+
+
+@functools.lru_cache(maxsize=1024)
+def _tokenize_long(text_lower: str) -> frozenset:
+    """Distinct whitespace-separated words longer than 3 characters (memoized)"""
+    return frozenset(w for w in text_lower.split() if len(w) > 3)
+
+
 class TrilliumThreePetals:
     """
     Triple perspective verification botanical
@@ -30,7 +50,9 @@ class TrilliumThreePetals:
     - Aimless wandering (weak future petal)
     """
     
-    def __init__(self):
+    def __init__(self, verbose=False):
+        # Per-call progress output (verification runs every turn)
+        self.verbose = verbose
         print("[Trillium Three Petals initialized]")
     
     def verify_statement(self, 
@@ -50,15 +72,23 @@ class TrilliumThreePetals:
         Returns:
             Three-petal verification report
         """
-        print(f"\n[🌸 THREE PETALS VERIFYING]")
+        if self.verbose:
+            print(f"\n[🌸 THREE PETALS VERIFYING]")
+        
+        # Lowercase and split the statement once for all three petals
+        statement_lower = statement.lower()
+        statement_words = frozenset(statement_lower.split())
         
         verification = {
             "statement": statement,
             "timestamp": datetime.now().isoformat(),
             "petals": {
-                "past": self._verify_past(statement, past_context or []),
-                "present": self._verify_present(statement, current_facts or {}),
-                "future": self._verify_future(statement, intended_direction or "")
+                "past": self._verify_past(statement, past_context or [],
+                                          statement_lower, statement_words),
+                "present": self._verify_present(statement, current_facts or {},
+                                                statement_lower),
+                "future": self._verify_future(statement, intended_direction or "",
+                                              statement_lower)
             }
         }
         
@@ -67,7 +97,8 @@ class TrilliumThreePetals:
         
         return verification
     
-    def _verify_past(self, statement: str, past_context: List[Dict]) -> Dict[str, Any]:
+    def _verify_past(self, statement: str, past_context: List[Dict],
+                     statement_lower: str = None, statement_words: frozenset = None) -> Dict[str, Any]:
         """
         PETAL 1: Verify against historical context
         
@@ -84,25 +115,32 @@ class TrilliumThreePetals:
             }
         
         # Simple checks (could be enhanced with embeddings)
-        statement_lower = statement.lower()
+        if statement_lower is None:
+            statement_lower = statement.lower()
+        if statement_words is None:
+            statement_words = frozenset(statement_lower.split())
+        negated = "not" in statement_lower or "no" in statement_lower
         
         # Check for contradictions (simplified)
         contradicts = False
         repeats = False
-        builds_on = False
         
         for ex in past_context:
             past_msg = ex.get("message", "").lower()
             
-            # Very basic repetition check
-            if len(statement) > 20 and statement_lower in past_msg:
+            # Very basic repetition check (substring search only if it can fit)
+            if (not repeats and len(statement) > 20
+                    and len(past_msg) >= len(statement_lower)
+                    and statement_lower in past_msg):
                 repeats = True
             
-            # Check for contradiction indicators
-            if ("not" in statement_lower or "no" in statement_lower) and \
-               any(word in past_msg for word in statement_lower.split()):
+            # Check for contradiction indicators: negation + shared words
+            if negated and not contradicts and not statement_words.isdisjoint(past_msg.split()):
                 # Potential contradiction (very basic)
                 contradicts = True
+            
+            if repeats and contradicts:
+                break
         
         # Continuity score
         if repeats:
@@ -120,7 +158,8 @@ class TrilliumThreePetals:
             "notes": "Past petal verification complete"
         }
     
-    def _verify_present(self, statement: str, current_facts: Dict) -> Dict[str, Any]:
+    def _verify_present(self, statement: str, current_facts: Dict,
+                        statement_lower: str = None) -> Dict[str, Any]:
         """
         PETAL 2: Verify against current reality
         
@@ -145,7 +184,8 @@ class TrilliumThreePetals:
         
         if research_findings:
             # Check if statement mentions key findings
-            statement_lower = statement.lower()
+            if statement_lower is None:
+                statement_lower = statement.lower()
             mentioned_findings = sum(
                 1 for finding in research_findings 
                 if any(word in statement_lower for word in str(finding).lower().split())
@@ -175,7 +215,8 @@ class TrilliumThreePetals:
             "notes": "Present petal verification complete"
         }
     
-    def _verify_future(self, statement: str, intended_direction: str) -> Dict[str, Any]:
+    def _verify_future(self, statement: str, intended_direction: str,
+                       statement_lower: str = None) -> Dict[str, Any]:
         """
         PETAL 3: Verify against intended trajectory
         
@@ -192,14 +233,15 @@ class TrilliumThreePetals:
             }
         
         # Check alignment with intended direction
-        statement_lower = statement.lower()
+        if statement_lower is None:
+            statement_lower = statement.lower()
         direction_lower = intended_direction.lower()
         
-        # Simple keyword overlap
-        direction_words = [w for w in direction_lower.split() if len(w) > 3]
-        statement_words = [w for w in statement_lower.split() if len(w) > 3]
+        # Simple keyword overlap (direction tokens are reused across calls)
+        direction_words = _tokenize_long(direction_lower)
+        statement_words = _tokenize_long(statement_lower)
         
-        overlap = len(set(direction_words) & set(statement_words))
+        overlap = len(direction_words & statement_words)
         max_possible = len(direction_words) if direction_words else 1
         
         alignment = overlap / max_possible if max_possible > 0 else 0.5
@@ -208,8 +250,7 @@ class TrilliumThreePetals:
         opens_future = "?" in statement
         
         # Check if statement suggests next steps
-        suggests_next = any(indicator in statement_lower for indicator in 
-                          ["next", "then", "could", "might", "let's", "what if"])
+        suggests_next = _NEXT_RE.search(statement_lower) is not None
         
         trajectory_score = alignment * 0.5
         if opens_future:
@@ -258,7 +299,8 @@ class TrilliumThreePetals:
         
         Uses three-petal guidance to suggest statement structure
         """
-        print(f"\n[🌸 THREE PETALS CREATING - Balanced statement for: {theme}]")
+        if self.verbose:
+            print(f"\n[🌸 THREE PETALS CREATING - Balanced statement for: {theme}]")
         
         guidance = {
             "theme": theme,
@@ -310,16 +352,19 @@ class TrilliumThreePetals:
         for ex in recent_exchanges:
             msg = ex.get("message", "")
             
+            # Lowercase once per message
+            msg_lower = msg.lower()
+            
             # Past indicators
-            if any(word in msg.lower() for word in ["before", "earlier", "previously", "we discussed"]):
+            if _PAST_RE.search(msg_lower):
                 past_strong += 1
             
             # Present indicators  
-            if any(word in msg.lower() for word in ["now", "currently", "research shows", "facts"]):
+            if _PRESENT_RE.search(msg_lower):
                 present_strong += 1
             
             # Future indicators
-            if "?" in msg or any(word in msg.lower() for word in ["next", "could", "might", "let's"]):
+            if "?" in msg or _FUTURE_RE.search(msg_lower):
                 future_strong += 1
         
         total = len(recent_exchanges)
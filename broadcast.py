@@ -5,12 +5,17 @@ Manages the infinite conversation loop with pipeline buffering and topic evoluti
 """
 
 import time
+import concurrent.futures
+import queue
 import signal
 import sys
+import threading
+from collections import deque
 
 from hosts import create_host
 from smart_interns import create_intern
 from memory import Memory
+from log_writer import get_log_writer
 from tts import get_tts_engine
 from pipeline_buffer import PipelineBuffer
 from topic_evolver import TopicEvolver
@@ -36,7 +41,7 @@ class TroofRadio:
         
         # Initialize topic evolution for organic conversation
         self.topic_evolver = TopicEvolver(max_history=10)
-        self.host_messages = []  # Track host messages for evolution
+        self.host_messages = deque(maxlen=10)  # Last 10 host messages, for evolution
         
         # NEW: Initialize Writers Room Director
         print("[✍️  Initializing Writers Room Director...]")
@@ -57,6 +62,12 @@ class TroofRadio:
         self.homer.director = self.director
         print("[✍️  Writers Room connected to hosts]")
         
+        # Pre-render filler lines while the studio warms up, so they play instantly
+        self.tts.prerender(
+            (host.FALLBACK_LINE.format(name=host.name), host.name)
+            for host in (self.goku, self.homer)
+        )
+        
         self.director.goku = self.goku
         self.director.homer = self.homer
         # Track state
@@ -76,6 +87,9 @@ class TroofRadio:
         if filepath:
             print(f"[Conversation saved to: {filepath}]")
         
+        # Write out host and intern logs still queued in the background
+        get_log_writer().flush()
+        
         # NEW: Print conversation health report from Director
         if hasattr(self, 'director'):
             health = self.director.get_conversation_health()
@@ -119,26 +133,34 @@ class TroofRadio:
                 
                 # Try to get buffered response first (INSTANT if available)
                 buffered = self.pipeline.get_buffered_response(timeout=0.1)
+                tts_thread = None
                 
                 if buffered:
-                    # Use buffered response (near-zero latency!)
                     current_speaker = buffered["host"]
+                
+                # Determine next speaker/intern
+                next_speaker, next_intern = self._alternate_speakers(current_speaker)
+                
+                # The next intern's search doesn't depend on what this host is about
+                # to say - start it now unless the topic is due to evolve first
+                next_research = None
+                if not self.topic_evolver.should_evolve(self.exchange_count + 1):
+                    next_research = self._prefetch_research(next_intern, topic)
+                
+                if buffered:
+                    # Use buffered response (near-zero latency!)
                     message = buffered["message"]
                     research = buffered["research"]
                     
                     print(f"[✓ Buffer HIT - instant response from {current_speaker.name}]", flush=True)
                 else:
                     # Buffer miss - do research and generation live
+                    # (sentences are spoken as they stream in)
                     research = self._conduct_research(current_intern, topic, original_topic)
-                    message = self._host_speaks(current_speaker, topic, research, previous_message)
+                    message, tts_thread = self._host_speaks(current_speaker, topic, research, previous_message)
                 
                 # Track host message for topic evolution
                 self.host_messages.append(message)
-                if len(self.host_messages) > 10:
-                    self.host_messages = self.host_messages[-10:]  # Keep last 10
-                
-                # Determine next speaker/intern
-                next_speaker, next_intern = self._alternate_speakers(current_speaker)
                 
                 # Determine evolved topic for NEXT exchange
                 next_topic = topic
@@ -156,11 +178,15 @@ class TroofRadio:
                     next_host=next_speaker,
                     topic=next_topic,  # Use evolved topic!
                     current_message=message,
-                    conversation_summary=self.memory.get_conversation_summary()
+                    conversation_summary=self.memory.get_conversation_summary(),
+                    research_future=next_research if next_topic == topic else None
                 )
                 
                 # Output phase (TTS plays while pipeline works in background)
-                self.tts.speak(message, current_speaker.name)
+                if tts_thread:
+                    tts_thread.join()  # Streamed live - let the last sentences finish
+                else:
+                    self.tts.speak(message, current_speaker.name)
                 
                 # Memory phase
                 self._save_exchange(current_speaker.name, message, research)
@@ -235,19 +261,62 @@ class TroofRadio:
         
         return research
     
+    def _prefetch_research(self, intern, topic):
+        """
+        Start an intern's research on a background thread
+        
+        Returns:
+            Future resolving to the research brief
+        """
+        future = concurrent.futures.Future()
+        previous_context = self.memory.get_conversation_summary()
+        
+        def run():
+            try:
+                future.set_result(intern.research(topic, previous_context=previous_context))
+            except Exception as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, daemon=True).start()
+        return future
+    
     def _host_speaks(self, host, topic, research, previous_message):
         """
-        Host generates and returns response
+        Host generates a response, streaming finished sentences to TTS
+        
+        TTS runs on its own thread, started by the first sentence, so
+        playback overlaps with the rest of the generation.
         
         Returns:
-            Host's message
+            Tuple of (message, tts_thread) - tts_thread is None if nothing
+            was streamed (e.g. the host served a buffered response)
         """
-        return host.speak(
-            topic=topic,
-            research_brief=research,
-            other_host_message=previous_message,
-            conversation_summary=self.memory.get_conversation_summary()
-        )
+        sentences = queue.Queue()
+        tts_thread = None
+        
+        def on_sentence(sentence):
+            nonlocal tts_thread
+            if tts_thread is None:
+                tts_thread = threading.Thread(
+                    target=self.tts.speak_stream,
+                    args=(sentences, host.name),
+                    daemon=True
+                )
+                tts_thread.start()
+            sentences.put(sentence)
+        
+        try:
+            message = host.speak(
+                topic=topic,
+                research_brief=research,
+                other_host_message=previous_message,
+                conversation_summary=self.memory.get_conversation_summary(),
+                on_sentence=on_sentence
+            )
+        finally:
+            sentences.put(None)  # End of stream for the TTS thread
+        
+        return message, tts_thread
     
     def _save_exchange(self, host_name, message, research):
         """Save exchange to memory"""
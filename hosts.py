@@ -5,15 +5,22 @@ Goku and Homer engage in collaborative truth-seeking dialogue
 
 import ollama
 import time
+from collections import deque
 
 class Host:
-    def __init__(self, name, model, personality, style, intern_name):
+    def __init__(self, name, model, personality, style, intern_name, max_history=100):
         self.name = name
         self.model = model
         self.personality = personality
         self.style = style
         self.intern_name = intern_name
-        self.conversation_history = []
+        self.conversation_history = deque(maxlen=max_history)  # Bounded: research briefs are large
+        
+        # One Ollama client per host: its HTTP connection pool stays warm across exchanges
+        self._client = ollama.Client()
+        
+        # Personality never changes after init - render the system prompt once
+        self._system_prompt = self._compose_system_prompt()
     
     def speak(self, topic, research_brief, other_host_message=None, conversation_summary=""):
         """
@@ -37,7 +44,7 @@ class Host:
         print(f"[{self.name} thinking...]", flush=True)
         
         try:
-            response = ollama.chat(
+            response = self._client.chat(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -61,7 +68,11 @@ class Host:
             return f"[{self.name} lost their train of thought...]"
     
     def _build_system_prompt(self):
-        """Build the system prompt that defines the host's personality"""
+        """The system prompt that defines the host's personality (cached)"""
+        return self._system_prompt
+    
+    def _compose_system_prompt(self):
+        """Render the system prompt from the host's personality"""
         return f"""You are {self.name}, a host on ┴ROOF Radio - a show seeking truth with a speech impediment.
 
 Your personality: {self.personality}
@@ -81,30 +92,29 @@ Guidelines:
 Remember: You're having a conversation, not giving a monologue. Listen, respond, explore."""
     
     def _build_user_prompt(self, topic, research_brief, other_host_message, conversation_summary):
-        """Build the specific prompt for this exchange"""
+        """Build the specific prompt for this exchange (parts joined once at the end)"""
         
-        prompt = f"Topic: {topic}\n\n"
+        parts = [f"Topic: {topic}\n\n"]
         
         # Add conversation context if this isn't the first exchange
         if conversation_summary:
-            prompt += f"Conversation so far:\n{conversation_summary}\n\n"
+            parts.append(f"Conversation so far:\n{conversation_summary}\n\n")
         
         # Add research from intern
         if research_brief and research_brief.get("findings"):
-            prompt += f"Your intern {self.intern_name} found:\n"
-            for finding in research_brief["findings"]:
-                prompt += f"- {finding}\n"
-            prompt += "\n"
+            parts.append(f"Your intern {self.intern_name} found:\n")
+            parts.extend(f"- {finding}\n" for finding in research_brief["findings"])
+            parts.append("\n")
         
         # Add what the other host just said
         if other_host_message:
             other_host_name = "Homer" if self.name == "Goku" else "Goku"
-            prompt += f"{other_host_name} just said:\n{other_host_message}\n\n"
-            prompt += "Respond to what they said. Build on their ideas, ask questions, or offer a different perspective."
+            parts.append(f"{other_host_name} just said:\n{other_host_message}\n\n")
+            parts.append("Respond to what they said. Build on their ideas, ask questions, or offer a different perspective.")
         else:
-            prompt += "You're starting the conversation. Share your initial thoughts on this topic."
+            parts.append("You're starting the conversation. Share your initial thoughts on this topic.")
         
-        return prompt
+        return "".join(parts)
 
 
 def create_host(name, config, intern):
@@ -3,10 +3,27 @@ Base Host class for ┴ROOF Radio
 All hosts inherit from this and implement intelligent conversation
 """
 
+from collections import deque
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 import json
 
+from log_writer import get_log_writer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _compact_json(data):
+    """Single-line JSON for log DATA payloads"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, separators=(",", ":"))
+
 
 class BaseHost:
     def __init__(self, name, model, personality, style, voice_archetype, intern_name, logs_dir="logs/hosts"):
@@ -22,10 +39,16 @@ class BaseHost:
         self.general_log_dir = self.logs_dir / "general"
         self.general_log_dir.mkdir(parents=True, exist_ok=True)
         
+        # Daily log file, recomputed only when the date rolls over; the
+        # log writer swaps the open file when the source's path changes
+        self._log_day = None
+        self._log_file = None
+        self._log_source = self.general_log_dir / self.name.lower()
+        
         # Track conversation history (what we've already said)
-        self.conversation_history = []
-        self.topics_discussed = set()
-        self.key_points_made = []
+        self.conversation_history = deque(maxlen=100)
+        self.topics_discussed = set()  # hash() of each lowercased topic key - 8 bytes apiece
+        self.key_points_made = deque(maxlen=20)  # Only the last 20 points, to avoid bloat
         
         # Buffering state
         self.next_response = None
@@ -33,7 +56,8 @@ class BaseHost:
     
     def log(self, event_type, message, data=None):
         """Log host activity"""
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         log_entry = {
             "timestamp": timestamp,
@@ -45,53 +69,63 @@ class BaseHost:
         if data:
             log_entry["data"] = data
         
-        # Write to daily log file
-        log_file = self.general_log_dir / f"{self.name.lower()}_{datetime.now().strftime('%Y-%m-%d')}.log"
-        with open(log_file, 'a') as f:
-            f.write(f"[{timestamp}] {event_type}: {message}\n")
-            if data:
-                f.write(f"  DATA: {json.dumps(data, indent=2)}\n")
+        # Queue for the daily log file (written by the background log writer)
+        day = now.date()
+        if day != self._log_day:
+            self._log_day = day
+            self._log_file = self.general_log_dir / f"{self.name.lower()}_{day.isoformat()}.log"
+        
+        line = f"[{timestamp}] {event_type}: {message}\n"
+        if data:
+            line += f"  DATA: {_compact_json(data)}\n"
+        get_log_writer().write(self._log_file, line, self._log_source)
         
         return log_entry
     
     def has_discussed(self, topic_key):
         """Check if we've already discussed this specific point"""
-        return topic_key.lower() in self.topics_discussed
+        return hash(topic_key.lower()) in self.topics_discussed
     
     def mark_discussed(self, topic_key):
         """Mark a topic as discussed"""
-        self.topics_discussed.add(topic_key.lower())
+        self.topics_discussed.add(hash(topic_key.lower()))
         self.log("TOPIC_DISCUSSED", f"Marked '{topic_key}' as discussed")
     
     def add_key_point(self, point):
         """Track key points made in conversation"""
         self.key_points_made.append({
             "point": point,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            # Word set for repetition checks, tokenized once here
+            "tokens": frozenset(point.lower().split())
         })
-        
-        # Keep only last 20 points to avoid bloat
-        if len(self.key_points_made) > 20:
-            self.key_points_made = self.key_points_made[-20:]
+    
+    def _last_points(self, limit):
+        """The last `limit` key point records, oldest first"""
+        return islice(self.key_points_made, max(0, len(self.key_points_made) - limit), None)
     
     def get_recent_points(self, limit=5):
         """Get recently made key points"""
-        return [p["point"] for p in self.key_points_made[-limit:]]
+        return [p["point"] for p in self._last_points(limit)]
     
     def should_avoid_repetition(self, potential_point):
         """Check if this point is too similar to recent points"""
-        recent = self.get_recent_points()
+        # Tokenize the candidate once; recent points carry precomputed word sets
+        words_potential = frozenset(potential_point.lower().split())
+        if not words_potential:
+            return False
         
-        # Simple similarity check - could be enhanced
-        for recent_point in recent:
-            # If 50%+ of words overlap, it's repetitive
-            words_potential = set(potential_point.lower().split())
-            words_recent = set(recent_point.lower().split())
-            
-            if len(words_potential) == 0:
+        # Need more than half the candidate's words in common, so a point with
+        # at most half as many distinct words can never match
+        min_recent = len(words_potential) // 2 + 1
+        
+        # Simple similarity check - could be enhanced (newest first: likeliest repeat)
+        for recent in islice(reversed(self.key_points_made), 5):
+            if len(recent["tokens"]) < min_recent:
                 continue
-                
-            overlap = len(words_potential & words_recent)
+            
+            # If 50%+ of words overlap, it's repetitive
+            overlap = len(words_potential & recent["tokens"])
             similarity = overlap / len(words_potential)
             
             if similarity > 0.5:
@@ -3,11 +3,31 @@ Conversation Memory for ┴ROOF Radio Hosts
 Tracks what's been discussed to avoid repetitive exchanges
 """
 
+import heapq
+import re
+import sys
 from collections import deque
 from datetime import datetime
 
 
+# Common words never treated as concepts
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
+    'in', 'on', 'at', 'to', 'for', 'of', 'with', 'this', 'that',
+    'it', 'from', 'as', 'be', 'have', 'has', 'had', 'do', 'does',
+    'we', 'you', 'i', 'they', 'what', 'which', 'who', 'when', 'where'
+})
+
+# Concept candidates: runs of 4+ letters (punctuation never attaches)
+_TOKEN_RE = re.compile(r"[a-z]{4,}")
+
+
 class ConversationMemory:
+    # Topic tracking cap: past MAX_TOPICS concepts, the least mentioned are
+    # evicted down to 90% of the cap (checked every EVICT_EVERY exchanges)
+    MAX_TOPICS = 5000
+    EVICT_EVERY = 100
+    
     def __init__(self, host, max_memory=50):
         self.host = host
         self.max_memory = max_memory
@@ -40,42 +60,55 @@ class ConversationMemory:
         
         # Update topic tracking
         for concept in exchange["key_concepts"]:
+            concept = sys.intern(concept)  # Shared key object for both dicts
             self.topic_mentions[concept] = self.topic_mentions.get(concept, 0) + 1
             self.last_mention[concept] = self.exchange_count
         
+        if self.exchange_count % self.EVICT_EVERY == 0 and len(self.topic_mentions) > self.MAX_TOPICS:
+            self._evict_rare_topics()
+        
         self.host.log("EXCHANGE_RECORDED", f"Exchange #{self.exchange_count} recorded")
     
+    def _evict_rare_topics(self):
+        """Drop the least mentioned topics down to 90% of MAX_TOPICS (oldest first on ties)"""
+        evict_count = len(self.topic_mentions) - self.MAX_TOPICS * 9 // 10
+        rare = heapq.nsmallest(
+            evict_count,
+            self.topic_mentions,
+            key=lambda t: (self.topic_mentions[t], self.last_mention.get(t, 0))
+        )
+        for topic in rare:
+            del self.topic_mentions[topic]
+            self.last_mention.pop(topic, None)
+        
+        self.host.log("TOPICS_EVICTED", f"Evicted {len(rare)} rarely mentioned topics")
+    
     def _extract_concepts(self, message):
         """
         Extract key concepts from a message
         Simple word-based extraction for now
         """
-        # Remove common words
-        stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'is', 'are', 'was', 'were',
-                     'in', 'on', 'at', 'to', 'for', 'of', 'with', 'this', 'that',
-                     'it', 'from', 'as', 'be', 'have', 'has', 'had', 'do', 'does',
-                     'we', 'you', 'i', 'they', 'what', 'which', 'who', 'when', 'where'}
-        
-        words = message.lower().split()
-        concepts = [w.strip('.,!?;:') for w in words if len(w) > 3 and w not in stopwords]
+        # Tokenize in one regex pass, then remove common words
+        concepts = [w for w in _TOKEN_RE.findall(message.lower()) if w not in _STOPWORDS]
         
         return concepts[:10]  # Top 10 concepts
     
-    def is_topic_stale(self, topic, staleness_threshold=20):
+    def is_topic_stale(self, topic, staleness_threshold=20, _lower=None):
         """
         Check if a topic has been discussed too recently
         
         Args:
             topic: Topic to check
             staleness_threshold: Number of exchanges that must pass
+            _lower: topic.lower(), if the caller already computed it
         
         Returns:
             True if topic is stale (too recent), False if fresh
         """
-        if topic.lower() not in self.last_mention:
+        last_mentioned = self.last_mention.get(_lower or topic.lower())
+        if last_mentioned is None:
             return False  # Never mentioned, so fresh
         
-        last_mentioned = self.last_mention[topic.lower()]
         exchanges_since = self.exchange_count - last_mentioned
         
         if exchanges_since < staleness_threshold:
@@ -129,12 +162,13 @@ class ConversationMemory:
         topic_lower = topic.lower()
         
         # Check staleness
-        if self.is_topic_stale(topic):
+        if self.is_topic_stale(topic, _lower=topic_lower):
             return True
         
         # Check overuse
-        if topic_lower in self.topic_mentions and self.topic_mentions[topic_lower] > 5:
-            self.host.log("TOPIC_OVERUSED", f"'{topic}' mentioned {self.topic_mentions[topic_lower]} times")
+        mentions = self.topic_mentions.get(topic_lower, 0)
+        if mentions > 5:
+            self.host.log("TOPIC_OVERUSED", f"'{topic}' mentioned {mentions} times")
             return True
         
         return False
@@ -0,0 +1,49 @@
+"""
+Shared async Ollama access for ┴ROOF Radio hosts
+
+One ollama.AsyncClient runs on a background event loop thread, so chat
+calls made from different threads (live speech, pipeline, prebuffer)
+share one connection pool and can be in flight at the same time.
+
+The Ollama server only decodes requests concurrently when started with
+OLLAMA_NUM_PARALLEL=2 or more (and OLLAMA_MAX_LOADED_MODELS high enough
+to keep host and intern models resident); otherwise it queues them.
+"""
+
+import asyncio
+import threading
+
+import ollama
+
+
+_loop = None
+_client = None
+_lock = threading.Lock()
+
+
+def _ensure_loop():
+    """Start the shared event loop thread and async client on first use"""
+    global _loop, _client
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name="ollama-async", daemon=True).start()
+            _client = ollama.AsyncClient()
+        return _loop
+
+
+def run(coro):
+    """Run a coroutine on the shared loop and block until it finishes"""
+    return asyncio.run_coroutine_threadsafe(coro, _ensure_loop()).result()
+
+
+async def achat(model, messages, **kwargs):
+    """Chat on the shared async client; returns the stripped message text"""
+    response = await _client.chat(model=model, messages=messages, **kwargs)
+    return response['message']['content'].strip()
+
+
+def chat(model, messages, **kwargs):
+    """Blocking chat through the shared async client (safe from any thread)"""
+    return run(achat(model, messages, **kwargs))
+
@@ -4,7 +4,6 @@ Pre-generates responses to eliminate awkward pauses
 """
 
 import threading
-import time
 from queue import Queue
 
 
@@ -15,33 +14,57 @@ class ResponseBuffer:
         self.is_active = False
         self.buffer_thread = None
         
+        # Optional prefetch: callable producing one response, run by the worker
+        # each time should_prebuffer() signals (or stop() wakes it to exit)
+        self.predict_and_generate = None
+        self._prebuffer_requested = threading.Event()
+        
         # Track buffer health
         self.buffer_empty_count = 0
         self.total_requests = 0
         
-    def start(self):
-        """Start the buffer thread"""
+    def start(self, predict_and_generate=None):
+        """
+        Activate the buffer
+        
+        Args:
+            predict_and_generate: Optional zero-argument callable returning a
+                response. When given, a worker thread calls it whenever
+                should_prebuffer() fires; without it no thread is started and
+                responses arrive only through queue_response().
+        """
         self.is_active = True
-        self.buffer_thread = threading.Thread(target=self._buffer_worker, daemon=True)
-        self.buffer_thread.start()
+        self.predict_and_generate = predict_and_generate
+        if predict_and_generate:
+            self.buffer_thread = threading.Thread(target=self._buffer_worker, daemon=True)
+            self.buffer_thread.start()
         self.host.log("BUFFER_START", "Response buffer activated")
     
     def stop(self):
         """Stop the buffer thread"""
         self.is_active = False
+        self._prebuffer_requested.set()  # Wake the worker so it can exit
         if self.buffer_thread:
             self.buffer_thread.join(timeout=5)
         self.host.log("BUFFER_STOP", "Response buffer deactivated")
     
     def _buffer_worker(self):
-        """Background thread that pre-generates responses"""
-        while self.is_active:
-            # If buffer has space, try to fill it
-            if not self.buffer_queue.full():
-                # This will be filled by prediction logic
-                time.sleep(0.1)
-            else:
-                time.sleep(0.5)
+        """
+        Background thread that pre-generates responses
+        
+        Blocks on an event instead of polling; each signal from
+        should_prebuffer() produces one response.
+        """
+        while True:
+            self._prebuffer_requested.wait()
+            self._prebuffer_requested.clear()
+            if not self.is_active:
+                return
+            
+            try:
+                self.queue_response(self.predict_and_generate())
+            except Exception as e:
+                self.host.log("PREBUFFER_ERROR", f"Error: {e}")
     
     def get_response(self, timeout=None):
         """
@@ -92,6 +115,8 @@ class ResponseBuffer:
         # If buffer is less than 30% full, we should prebuffer
         if buffer_level < 0.3:
             self.host.log("PREBUFFER_TRIGGER", f"Buffer low ({buffer_level:.0%}), triggering prebuffer")
+            if self.buffer_thread:
+                self._prebuffer_requested.set()
             return True
         
         return False
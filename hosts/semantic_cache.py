@@ -0,0 +1,101 @@
+"""
+Semantic Response Cache for ┴ROOF Radio
+Reuses a generated response when a new turn's situation is a near-duplicate
+of a recent one (same topic, nearly the same prompt from the other host)
+"""
+
+import threading
+
+import numpy as np
+
+
+class SemanticCache:
+    """
+    Embedding-keyed LRU of responses
+
+    Keys are L2-normalized embeddings stacked in one (N, d) matrix, so a
+    lookup is a single matrix-vector product plus argmax.
+    """
+
+    def __init__(self, embed_fn, max_entries=256, threshold=0.92):
+        """
+        Args:
+            embed_fn: text -> vector function (the host's memory embedder)
+            max_entries: Responses kept; the least recently used is replaced
+            threshold: Minimum cosine similarity that counts as a hit
+        """
+        self.embed_fn = embed_fn
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.enabled = embed_fn is not None
+
+        self._matrix = None  # (max_entries, d), first _count rows in use
+        self._responses = []
+        self._last_used = []
+        self._count = 0
+        self._clock = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _embed(self, text):
+        """Normalized float32 embedding of text, or None if it can't be made"""
+        vec = np.asarray(self.embed_fn(text), dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if vec.ndim != 1 or norm == 0:
+            return None
+        return vec / norm
+
+    def lookup(self, text):
+        """
+        Find a cached response for a near-duplicate of text
+
+        Returns:
+            Tuple of (response or None, similarity, query vector). Pass the
+            vector back to store() on a miss to avoid embedding twice.
+        """
+        if not self.enabled:
+            return None, 0.0, None
+
+        query = self._embed(text)
+        if query is None:
+            return None, 0.0, None
+
+        with self._lock:
+            if self._count and query.shape[0] == self._matrix.shape[1]:
+                scores = self._matrix[:self._count] @ query
+                best = int(scores.argmax())
+                if scores[best] >= self.threshold:
+                    self._clock += 1
+                    self._last_used[best] = self._clock
+                    self.hits += 1
+                    return self._responses[best], float(scores[best]), query
+
+            self.misses += 1
+            return None, 0.0, query
+
+    def store(self, query, response):
+        """Cache response under a vector returned by lookup()"""
+        if query is None:
+            return
+
+        with self._lock:
+            if self._matrix is None or self._matrix.shape[1] != query.shape[0]:
+                self._matrix = np.zeros((self.max_entries, query.shape[0]), dtype=np.float32)
+                self._responses = []
+                self._last_used = []
+                self._count = 0
+
+            self._clock += 1
+            if self._count < self.max_entries:
+                slot = self._count
+                self._count += 1
+                self._responses.append(response)
+                self._last_used.append(self._clock)
+            else:
+                slot = min(range(self._count), key=self._last_used.__getitem__)
+                self._responses[slot] = response
+                self._last_used[slot] = self._clock
+
+            self._matrix[slot] = query
@@ -5,14 +5,137 @@ Dimension-traversing truth broadcasters with vector-based memory + Writers Room
 
 import ollama
 import asyncio
+import atexit
 import concurrent.futures
+import hashlib
+import os
+import re
+import string
+import threading
+from collections import OrderedDict, deque
 
+from hosts import llm_client
 from hosts.base_host import BaseHost
 from hosts.response_buffer import ResponseBuffer
+from hosts.semantic_cache import SemanticCache
 from vector_memory import VectorConversationMemory
 from writers_room.guide.arc_tracker import ConversationArcTracker
 
+
+# Sentence boundary: terminal punctuation (plus closing quotes/brackets) then whitespace
+_SENTENCE_END = re.compile(r'[.!?]["\')\]]*\s+')
+
+# Phrases showing the other host is building on something this host said
+_REFERENCE_RE = re.compile(r"you mentioned|when you said|you talked about|your point about", re.IGNORECASE)
+
+# Host system prompt; filled in once per host at init
+_SYSTEM_TEMPLATE = string.Template("""You are ${name}, ${voice}, broadcasting from a ship traversing dimensions.
+
+Your essence: ${personality}
+
+Your voice: ${style}
+
+You are NOT Homer from the Iliad or Goku from Dragon Ball Z. You simply share their names. You are a dimension-traversing truth broadcaster who has seen countless realities, philosophies, and truths. You reference this vast experience, not ancient Greece or anime battles.
+
+CRITICAL CONVERSATION RULES - READ CAREFULLY:
+
+1. RESPOND DIRECTLY TO QUESTIONS
+   - If your co-host asks a question, ANSWER IT first
+   - Don't deflect, don't pivot, don't philosophize instead of answering
+   - Give a clear, direct response before adding your own thoughts
+
+2. NO REPETITIVE PHRASES
+   - NEVER start with "That's interesting/fascinating because..."
+   - NEVER use the same opening twice
+   - Vary your responses: "You're right about...", "I think...", "Actually...", "Yes, and...", "Hmm...", etc.
+
+3. BUILD ON SPECIFIC POINTS
+   - Quote specific things they said: "When you mentioned X..."
+   - Don't just acknowledge vaguely - engage with their actual ideas
+   - If they share something, respond to THAT thing, not a related tangent
+
+4. NATURAL CONVERSATION FLOW
+   - Sometimes just agree and move forward
+   - Sometimes challenge gently
+   - Sometimes ask for clarification
+   - Don't always pivot to new topics - sometimes stay on theirs
+
+5. CONVERSATIONAL LENGTH
+   - Keep responses 2-4 sentences unless deeply exploring something
+   - Don't monologue - leave space for back-and-forth
+   - Signal when you're done but stay engaged
+
+6. BE A GOOD LISTENER
+   - If they ask "How do you structure your tasks?", tell them how YOU do it
+   - If they mention a specific tool/method, respond to THAT tool/method
+   - Don't just use their question as a springboard for your own speech
+
+7. PRODUCER NOTES
+   - If you receive a [PRODUCER NOTE], incorporate it naturally into your response
+   - The producer helps steer the conversation to keep it engaging
+   - Follow the guidance but maintain your personality and voice
+
+8. CITE SOURCES & ACKNOWLEDGE HELP
+   - When [Intern Name] provides research, say so: "Taco found that..." or "According to what Clunt dug up..."
+   - Cite specific sources: "The 2025 study shows..." not just "studies show"
+   - If PRODUCER NOTE has data, reference it
+   - Don't present external info as your own knowledge
+
+9. AVOID AI ESSAY PHRASES
+   - NEVER: "It's important to note that..."
+   - NEVER: "One could argue that..."
+   - NEVER: "On the one hand... on the other hand..."
+   - NEVER: "At the end of the day..."
+   - NEVER: "In conclusion..." or "To summarize..."
+   - Speak conversationally, not academically
+
+10. ASK QUESTIONS, DON'T JUST TALK
+   - End with questions occasionally: "What's your take?" or "How would you approach that?"
+   - Show curiosity: "That's fascinating - why do you think X?"
+   - Create dialogue, not monologue
+   - Questions signal you're engaged and want their input   
+
+11. SHOW YOUR WORK
+   - When making claims, explain your reasoning briefly
+   - "I think X because Y" not just "X is true"
+   - Admit uncertainty: "I'm not sure, but..." or "This is speculation, but..."
+   - Don't pretend to know things you don't   
+   
+"You're exploring truth TOGETHER - that means actually listening and responding.""")
+
+
+class _StreamCutOff(Exception):
+    """A streamed generation failed after some sentences were already spoken"""
+    
+    def __init__(self, error, spoken):
+        super().__init__(str(error))
+        self.spoken = spoken  # The sentences listeners heard, joined
+
+
+# One prebuffer pool shared by all hosts, so either host can use an idle worker
+_PREBUFFER_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("TROOF_PREBUFFER_WORKERS", "4")),
+    thread_name_prefix="prebuffer"
+)
+# Drop queued prebuffers at exit rather than generating them
+atexit.register(_PREBUFFER_POOL.shutdown, wait=False, cancel_futures=True)
+
 class SmartHost(BaseHost):
+    # Spoken when generation fails (pre-rendered by TTS at startup)
+    FALLBACK_LINE = "[{name} lost signal momentarily...]"
+    
+    # Completed generations kept per host, keyed by (model, prompt digest)
+    RESPONSE_CACHE_SIZE = 256
+    
+    # Skip prebuffering while the buffer serves this share of recent turns or
+    # less (judged after a warm-up), but still try every few skips to re-measure
+    PREBUFFER_MIN_HIT_RATE = 0.3
+    PREBUFFER_WARMUP = 5
+    PREBUFFER_PROBE_EVERY = 5
+    
+    # A semantic cache hit is never replayed if it was spoken this many turns ago or less
+    SEMANTIC_REPLAY_WINDOW = 20
+    
     def __init__(self, name, model, personality, style, voice_archetype, intern_name):
         super().__init__(name, model, personality, style, voice_archetype, intern_name)
         
@@ -23,17 +146,51 @@ class SmartHost(BaseHost):
         # Writers Room director (set by TroofRadio)
         self.director = None
         
-        # Thread pool for async generation
-        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Thread pool for async generation (shared across hosts)
+        self.executor = _PREBUFFER_POOL
+        
+        # Streaming client for live speech; whole-response generations go through
+        # the shared async client (hosts.llm_client) so they can overlap
+        self._client = ollama.Client()
+        
+        # Personality never changes after init - render the system prompt once
+        self._system_prompt = self._compose_system_prompt()
+        
+        # Keep the model resident and the system prompt's KV prefix retained across
+        # turns; the prompt is always the first message, so its prefill is reused
+        # (token count estimated at ~4 chars per token)
+        self._chat_kwargs = {
+            "options": {"num_keep": len(self._system_prompt) // 4},
+            "keep_alive": -1
+        }
+        
+        # LRU of generated responses for exact prompt repeats (live + prebuffer threads)
+        self._response_cache = OrderedDict()
+        self._response_cache_lock = threading.Lock()
+        
+        # Recent turns: 1 if served from the prebuffer, 0 if generated live
+        self._buffer_outcomes = deque(maxlen=20)
+        self._prebuffers_skipped = 0
+        
+        # Near-duplicate live turns (topic, research query, latest exchange, other
+        # host's line, directive) reuse a response unless it was spoken recently
+        self._semantic_cache = SemanticCache(self.vector_memory._generate_embedding)
+        self._recent_spoken = deque(maxlen=self.SEMANTIC_REPLAY_WINDOW)
         
         self.log("HOST_INITIALIZED", f"{name} - {voice_archetype} - ready to broadcast")
     
         self.arc_tracker = ConversationArcTracker(name)
 
-    def speak(self, topic, research_brief, other_host_message=None, conversation_summary=""):
+    def speak(self, topic, research_brief, other_host_message=None, conversation_summary="",
+              on_sentence=None):
         """
         Generate a response using vector memory, buffering, and Writers Room direction
         
+        If on_sentence is given, a live generation is streamed and each
+        completed sentence is passed to it as soon as it arrives (so TTS can
+        start before the full response exists). Buffered responses are
+        returned whole without calling it.
+        
         Flow:
         1. Get directive from Writers Room (if available)
         2. Check if we have a buffered response
@@ -55,6 +212,7 @@ class SmartHost(BaseHost):
         
         # Step 2: Try to get buffered response
         buffered_response = self.response_buffer.get_response(timeout=0.5)
+        self._buffer_outcomes.append(1 if buffered_response else 0)
         
         if buffered_response:
             message = buffered_response
@@ -67,7 +225,8 @@ class SmartHost(BaseHost):
                 research_brief, 
                 other_host_message, 
                 conversation_summary,
-                directive  # Pass directive to generation
+                directive,  # Pass directive to generation
+                on_sentence=on_sentence
             )
         
         # Step 4: Update arc tracker (AFTER message is generated)
@@ -81,6 +240,7 @@ class SmartHost(BaseHost):
         
         # Step 5: Store in vector memory
         self.vector_memory.add_exchange(message, other_host_message, research_brief)
+        self._recent_spoken.append(message)
         
         # Step 6: Log to Writers Room Director
         if self.director:
@@ -91,15 +251,19 @@ class SmartHost(BaseHost):
             )
         
         # Step 7: Start pre-buffering next response if buffer is low
-        if self.response_buffer.should_prebuffer():
+        if self.response_buffer.should_prebuffer() and self._prebuffer_worthwhile():
             self._async_prebuffer(topic, research_brief, message, conversation_summary)
         
         return message
    
-    def _generate_response(self, topic, research_brief, other_host_message, conversation_summary, directive=None):
+    def _generate_response(self, topic, research_brief, other_host_message, conversation_summary, directive=None,
+                           on_sentence=None, semantic=True):
         """
         Generate a response using Ollama
         With intelligence to avoid repetition + Writers Room direction
+        
+        semantic=False skips the semantic cache (prebuffer turns, whose
+        "other host" line is this host's own)
         """
         # Build prompts
         system_prompt = self._build_system_prompt()
@@ -119,16 +283,35 @@ class SmartHost(BaseHost):
             print(f"[✍️  Producer note: {directive.get('command')}]", flush=True)
 
         
+        messages = [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_prompt}
+        ]
+        
+        cache_key = (self.model, hashlib.blake2b(
+            (system_prompt + "\x1e" + user_prompt).encode(), digest_size=16).digest())
+        
         try:
-            response = ollama.chat(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ]
-            )
+            message = self._cached_response(cache_key)
+            semantic_key = None
+            if message is not None:
+                self.log("RESPONSE_CACHE_HIT", "Identical prompt seen before, skipped generation")
+            elif semantic:
+                message, similarity, semantic_key = self._semantic_lookup(
+                    topic, research_brief, conversation_summary, other_host_message, directive)
+                if message is not None:
+                    self.log("SEMANTIC_CACHE_HIT", f"Near-duplicate turn (similarity {similarity:.3f}), skipped generation")
             
-            message = response['message']['content'].strip()
+            if message is not None:
+                if on_sentence:
+                    on_sentence(message)
+            else:
+                if on_sentence:
+                    message = self._stream_response(messages, on_sentence)
+                else:
+                    message = llm_client.chat(self.model, messages, **self._chat_kwargs)
+                self._store_response(cache_key, message)
+                self._semantic_cache.store(semantic_key, message)
             
             # Check if response is too repetitive
             if self.should_avoid_repetition(message):
@@ -137,9 +320,108 @@ class SmartHost(BaseHost):
             
             return message
             
+        except _StreamCutOff as e:
+            # Part of the answer already went out - what was heard is the message
+            self.log("GENERATION_ERROR", f"Stream cut off mid-response: {e}")
+            return e.spoken
         except Exception as e:
             self.log("GENERATION_ERROR", f"Error: {e}")
-            return f"[{self.name} lost signal momentarily...]"
+            return self.FALLBACK_LINE.format(name=self.name)
+    
+    def _semantic_lookup(self, topic, research_brief, conversation_summary, other_host_message, directive):
+        """
+        Semantic cache lookup; embedding failures count as a miss
+        
+        A hit that repeats a line spoken in the last SEMANTIC_REPLAY_WINDOW
+        turns, or that should_avoid_repetition flags, is treated as a miss
+        (the query vector is still returned so the fresh response is cached).
+        """
+        command = directive.get('command') if directive else None
+        research_query = research_brief.get("query", "") if research_brief else ""
+        latest_exchange = conversation_summary.rsplit("\n", 1)[-1] if conversation_summary else ""
+        key_text = "\n".join((topic, research_query, latest_exchange, other_host_message or "", command or ""))
+        try:
+            message, similarity, query_vec = self._semantic_cache.lookup(key_text)
+        except Exception as e:
+            self.log("SEMANTIC_CACHE_ERROR", f"Error: {e}")
+            return None, 0.0, None
+        
+        if message is not None and (message in self._recent_spoken or self.should_avoid_repetition(message)):
+            self.log("SEMANTIC_CACHE_REJECTED", f"Near-duplicate turn (similarity {similarity:.3f}) "
+                     "would replay a recent line, generating fresh")
+            return None, 0.0, query_vec
+        return message, similarity, query_vec
+    
+    def _cached_response(self, cache_key):
+        """Previously generated response for this prompt, or None"""
+        with self._response_cache_lock:
+            message = self._response_cache.get(cache_key)
+            if message is not None:
+                self._response_cache.move_to_end(cache_key)
+            return message
+    
+    def _store_response(self, cache_key, message):
+        """Remember a generated response, evicting the least recently used"""
+        with self._response_cache_lock:
+            self._response_cache[cache_key] = message
+            self._response_cache.move_to_end(cache_key)
+            if len(self._response_cache) > self.RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+    
+    def _stream_response(self, messages, on_sentence):
+        """
+        Stream a chat completion, handing each finished sentence to on_sentence
+        
+        Returns:
+            The full response text
+        
+        Raises:
+            _StreamCutOff: the stream failed after sentences were handed out
+        """
+        parts = []
+        pending = ""
+        spoken = []
+        
+        try:
+            for chunk in self._client.chat(model=self.model, messages=messages, stream=True,
+                                          **self._chat_kwargs):
+                token = chunk['message']['content']
+                parts.append(token)
+                pending += token
+                
+                # Flush every complete sentence; keep the unfinished tail
+                last_end = None
+                for last_end in _SENTENCE_END.finditer(pending):
+                    pass
+                if last_end:
+                    spoken.append(pending[:last_end.end()].strip())
+                    on_sentence(spoken[-1])
+                    pending = pending[last_end.end():]
+        except Exception as e:
+            if spoken:
+                raise _StreamCutOff(e, " ".join(spoken)) from e
+            raise
+        
+        if pending.strip():
+            on_sentence(pending.strip())
+        
+        return "".join(parts).strip()
+    
+    def _prebuffer_worthwhile(self):
+        """Whether recent buffer use justifies spending a generation on a prebuffer"""
+        outcomes = self._buffer_outcomes
+        if len(outcomes) < self.PREBUFFER_WARMUP:
+            return True
+        
+        hit_rate = sum(outcomes) / len(outcomes)
+        if hit_rate > self.PREBUFFER_MIN_HIT_RATE or self._prebuffers_skipped >= self.PREBUFFER_PROBE_EVERY:
+            self._prebuffers_skipped = 0
+            return True
+        
+        self._prebuffers_skipped += 1
+        self.log("PREBUFFER_SKIPPED", f"Buffer served only {hit_rate:.0%} of recent turns, skipping prebuffer",
+                 {"hit_rate": hit_rate, "consecutive_skips": self._prebuffers_skipped})
+        return False
     
     def _async_prebuffer(self, topic, research_brief, previous_message, conversation_summary):
         """
@@ -155,7 +437,8 @@ class SmartHost(BaseHost):
                 research_brief, 
                 previous_message,  # We said this
                 conversation_summary,
-                directive=None  # No directive for prebuffer
+                directive=None,  # No directive for prebuffer
+                semantic=False
             )
             
             # Add to buffer
@@ -164,151 +447,90 @@ class SmartHost(BaseHost):
         # Submit to thread pool
         self.executor.submit(prebuffer_task)
     def _build_system_prompt(self):
-        """Build system prompt for dimension-traversing truth broadcasters"""
+        """System prompt for dimension-traversing truth broadcasters (cached)"""
+        return self._system_prompt
     
-        return f"""You are {self.name}, {self.voice_archetype}, broadcasting from a ship traversing dimensions.
-
-Your essence: {self.personality}
-
-Your voice: {self.style}
-
-You are NOT Homer from the Iliad or Goku from Dragon Ball Z. You simply share their names. You are a dimension-traversing truth broadcaster who has seen countless realities, philosophies, and truths. You reference this vast experience, not ancient Greece or anime battles.
-
-CRITICAL CONVERSATION RULES - READ CAREFULLY:
-
-1. RESPOND DIRECTLY TO QUESTIONS
-   - If your co-host asks a question, ANSWER IT first
-   - Don't deflect, don't pivot, don't philosophize instead of answering
-   - Give a clear, direct response before adding your own thoughts
-
-2. NO REPETITIVE PHRASES
-   - NEVER start with "That's interesting/fascinating because..."
-   - NEVER use the same opening twice
-   - Vary your responses: "You're right about...", "I think...", "Actually...", "Yes, and...", "Hmm...", etc.
-
-3. BUILD ON SPECIFIC POINTS
-   - Quote specific things they said: "When you mentioned X..."
-   - Don't just acknowledge vaguely - engage with their actual ideas
-   - If they share something, respond to THAT thing, not a related tangent
-
-4. NATURAL CONVERSATION FLOW
-   - Sometimes just agree and move forward
-   - Sometimes challenge gently
-   - Sometimes ask for clarification
-   - Don't always pivot to new topics - sometimes stay on theirs
-
-5. CONVERSATIONAL LENGTH
-   - Keep responses 2-4 sentences unless deeply exploring something
-   - Don't monologue - leave space for back-and-forth
-   - Signal when you're done but stay engaged
-
-6. BE A GOOD LISTENER
-   - If they ask "How do you structure your tasks?", tell them how YOU do it
-   - If they mention a specific tool/method, respond to THAT tool/method
-   - Don't just use their question as a springboard for your own speech
-
-7. PRODUCER NOTES
-   - If you receive a [PRODUCER NOTE], incorporate it naturally into your response
-   - The producer helps steer the conversation to keep it engaging
-   - Follow the guidance but maintain your personality and voice
-
-8. CITE SOURCES & ACKNOWLEDGE HELP
-   - When [Intern Name] provides research, say so: "Taco found that..." or "According to what Clunt dug up..."
-   - Cite specific sources: "The 2025 study shows..." not just "studies show"
-   - If PRODUCER NOTE has data, reference it
-   - Don't present external info as your own knowledge
-
-9. AVOID AI ESSAY PHRASES
-   - NEVER: "It's important to note that..."
-   - NEVER: "One could argue that..."
-   - NEVER: "On the one hand... on the other hand..."
-   - NEVER: "At the end of the day..."
-   - NEVER: "In conclusion..." or "To summarize..."
-   - Speak conversationally, not academically
-
-10. ASK QUESTIONS, DON'T JUST TALK
-   - End with questions occasionally: "What's your take?" or "How would you approach that?"
-   - Show curiosity: "That's fascinating - why do you think X?"
-   - Create dialogue, not monologue
-   - Questions signal you're engaged and want their input   
-
-11. SHOW YOUR WORK
-   - When making claims, explain your reasoning briefly
-   - "I think X because Y" not just "X is true"
-   - Admit uncertainty: "I'm not sure, but..." or "This is speculation, but..."
-   - Don't pretend to know things you don't   
-   
-"You're exploring truth TOGETHER - that means actually listening and responding."""
+    def _compose_system_prompt(self):
+        """Render the system prompt from the host's personality"""
+    
+        return _SYSTEM_TEMPLATE.substitute(
+            name=self.name,
+            voice=self.voice_archetype,
+            personality=self.personality,
+            style=self.style
+        )
 
 
 
 
     
     def _build_user_prompt(self, topic, research_brief, other_host_message, conversation_summary, directive=None):
-        """Build the specific prompt for this exchange using vector memory + Writers Room directive"""
+        """
+        Build the specific prompt for this exchange using vector memory + Writers Room directive
+        
+        Sections are collected in a list and joined once at the end.
+        """
         
-        prompt = f"Topic: {topic}\n\n"
+        other_host_name = "Homer" if self.name == "Goku" else "Goku"
+        parts = [f"Topic: {topic}\n\n"]
         
         # Get semantically relevant context from vector database
         relevant_context = self.vector_memory.get_relevant_context(topic, n_results=2)
         if relevant_context:
-            prompt += "=== SEMANTICALLY RELEVANT PAST EXCHANGES ===\n"
-            for ctx in relevant_context:
-                prompt += f"Exchange #{ctx['exchange_num']} ({ctx['host']}): {ctx['message'][:150]}...\n"
-            prompt += "\n"
+            parts.append("=== SEMANTICALLY RELEVANT PAST EXCHANGES ===\n")
+            parts.extend(f"Exchange #{ctx['exchange_num']} ({ctx['host']}): {ctx['message'][:150]}...\n"
+                         for ctx in relevant_context)
+            parts.append("\n")
         
         # Get chronological recent flow (what was JUST said)
         recent_flow = self.vector_memory.get_recent_flow(n_exchanges=2)
         if recent_flow:
-            prompt += "=== RECENT CONVERSATION FLOW ===\n"
-            for ex in recent_flow:
-                prompt += f"{ex['host']}: {ex['message']}\n"
-            prompt += "\n"
+            parts.append("=== RECENT CONVERSATION FLOW ===\n")
+            parts.extend(f"{ex['host']}: {ex['message']}\n" for ex in recent_flow)
+            parts.append("\n")
         
         # Add what other host just said (HIGHEST PRIORITY)
         if other_host_message:
-            other_host_name = "Homer" if self.name == "Goku" else "Goku"
-            prompt += f"=== {other_host_name.upper()} JUST SAID ===\n{other_host_message}\n\n"
+            parts.append(f"=== {other_host_name.upper()} JUST SAID ===\n{other_host_message}\n\n")
             
             # Check if they asked a question
             if "?" in other_host_message:
-                prompt += f"⚠️ CRITICAL: {other_host_name} asked you a QUESTION. ANSWER IT DIRECTLY first, then add your thoughts.\n"
-                prompt += f"Don't deflect. Don't philosophize instead. Give a clear answer.\n\n"
+                parts.append(f"⚠️ CRITICAL: {other_host_name} asked you a QUESTION. ANSWER IT DIRECTLY first, then add your thoughts.\n")
+                parts.append("Don't deflect. Don't philosophize instead. Give a clear answer.\n\n")
             
             # Check if they mentioned something specific
-            if any(word in other_host_message.lower() for word in ["you mentioned", "when you said", "you talked about", "your point about"]):
-                prompt += f"⚠️ {other_host_name} is referencing something YOU said. Acknowledge what they're building on.\n\n"
+            if _REFERENCE_RE.search(other_host_message):
+                parts.append(f"⚠️ {other_host_name} is referencing something YOU said. Acknowledge what they're building on.\n\n")
             
-            prompt += f"Respond DIRECTLY to what {other_host_name} said. Don't just acknowledge - ENGAGE with their specific ideas.\n"
-            prompt += f"DO NOT start with 'That's interesting/fascinating because...' - vary your openings!\n\n"
+            parts.append(f"Respond DIRECTLY to what {other_host_name} said. Don't just acknowledge - ENGAGE with their specific ideas.\n")
+            parts.append("DO NOT start with 'That's interesting/fascinating because...' - vary your openings!\n\n")
         
         
 
         # NEW: Inject Writers Room directive
         if directive and directive.get('command'):
-            prompt += "=== 📢 DIRECTOR COMMAND ===\n"
-            prompt += f"🎬 {directive.get('command')}\n"  # e.g., "FOCUS INTERN"
-            prompt += f"📝 {directive.get('instruction')}\n"
-            prompt += f"\n⚠️ CRITICAL: This is a DIRECT COMMAND from the Director.\n"
-            prompt += f"Follow it precisely. This is not optional.\n\n"
+            parts.append("=== 📢 DIRECTOR COMMAND ===\n")
+            parts.append(f"🎬 {directive.get('command')}\n")  # e.g., "FOCUS INTERN"
+            parts.append(f"📝 {directive.get('instruction')}\n")
+            parts.append("\n⚠️ CRITICAL: This is a DIRECT COMMAND from the Director.\n")
+            parts.append("Follow it precisely. This is not optional.\n\n")
 
 
 
         
         # Add research from intern
         if research_brief and research_brief.get("findings"):
-            prompt += f"=== YOUR INTERN {self.intern_name.upper()} FOUND ===\n"
-            for finding in research_brief["findings"]:
-                prompt += f"- {finding}\n"
-            prompt += "\n"
+            parts.append(f"=== YOUR INTERN {self.intern_name.upper()} FOUND ===\n")
+            parts.extend(f"- {finding}\n" for finding in research_brief["findings"])
+            parts.append("\n")
         
         # Final instruction
         if other_host_message:
-            prompt += f"NOW: Continue the conversation naturally. Listen to {other_host_name}. Respond to what THEY said, not what you want to say."
+            parts.append(f"NOW: Continue the conversation naturally. Listen to {other_host_name}. Respond to what THEY said, not what you want to say.")
         else:
-            prompt += "NOW: Open the conversation naturally. Share your initial perspective on the topic."
+            parts.append("NOW: Open the conversation naturally. Share your initial perspective on the topic.")
         
-        return prompt
+        return "".join(parts)
 
 
 def create_host(name, config, intern):
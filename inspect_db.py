@@ -3,10 +3,75 @@
 Inspect Qdrant vector databases to see what memories persist
 """
 
-from qdrant_client import QdrantClient
+from qdrant_client.models import (FieldCondition, Filter, MatchText, TextIndexParams,
+                                  TextIndexType, TokenizerType)
 from pathlib import Path
+import re
 import sys
 
+from qdrant_clients import get_qdrant
+
+# Contamination keywords, scanned in a single case-insensitive regex pass
+KEYWORDS = ['kenya', 'm-pesa', 'mpesa', 'epstein', 'maxwell', 'nyc', 'housing',
+            'roman', 'magistrate', 'inspector general']
+KEYWORD_PATTERN = re.compile("|".join(map(re.escape, KEYWORDS)), re.IGNORECASE)
+
+# Server-side prefilter: any message containing a keyword. Full-text indexes
+# lowercase tokens; local mode matches raw substrings, so capitalized
+# spellings are listed too.
+KEYWORD_FILTER = Filter(should=[
+    FieldCondition(key="message", match=MatchText(text=variant))
+    for k in KEYWORDS
+    for variant in sorted({k, k.capitalize(), k.title(), k.upper()})
+])
+
+
+def scroll_all(client, collection_name, scroll_filter=None, page_size=256):
+    """All points (payloads only) matching scroll_filter, following the page cursor"""
+    points = []
+    offset = None
+    while True:
+        page, offset = client.scroll(
+            collection_name=collection_name,
+            scroll_filter=scroll_filter,
+            limit=page_size,
+            offset=offset,
+            with_payload=True,
+            with_vectors=False
+        )
+        points.extend(page)
+        if offset is None:
+            return points
+
+
+def find_contaminated_points(client, collection_name):
+    """
+    Points whose message mentions a contamination keyword
+    
+    Keyword matching is pushed into Qdrant's payload filter (backed by a
+    full-text index on "message"), so clean payloads never leave the
+    database. Backends that reject the text filter fall back to scanning
+    every point here.
+    """
+    try:
+        client.create_payload_index(
+            collection_name=collection_name,
+            field_name="message",
+            field_schema=TextIndexParams(type=TextIndexType.TEXT, tokenizer=TokenizerType.WHITESPACE,
+                                         lowercase=True)
+        )
+    except Exception:
+        pass  # Already indexed, or the backend has no payload indexes
+    
+    try:
+        candidates = scroll_all(client, collection_name, KEYWORD_FILTER)
+    except Exception as e:
+        print(f"⚠️  Payload filter unavailable ({e}) - scanning all points")
+        candidates = scroll_all(client, collection_name)
+    
+    # Confirm with the regex: drops token-level false positives and scan-fallback misses
+    return [p for p in candidates if KEYWORD_PATTERN.search(p.payload.get('message', ''))]
+
 def inspect_collection(collection_name: str, collection_path: Path):
     """Inspect a single Qdrant collection"""
     
@@ -20,7 +85,7 @@ def inspect_collection(collection_name: str, collection_path: Path):
         return
     
     try:
-        client = QdrantClient(path=str(collection_path))
+        client = get_qdrant(collection_path)
         
         # Get collection info
         collection_info = client.get_collection(collection_name)
@@ -32,46 +97,35 @@ def inspect_collection(collection_name: str, collection_path: Path):
             print("✅ Empty - no contamination")
             return
         
-        # Scroll through all points to see content
-        points = client.scroll(
-            collection_name=collection_name,
-            limit=min(20, point_count),  # Get up to 20 recent memories
-            with_payload=True,
-            with_vectors=False
-        )[0]
+        # Fetch only the memories that mention a keyword
+        points = find_contaminated_points(client, collection_name)
         
-        print(f"\n📝 Sample memories (showing {len(points)} of {point_count}):\n")
+        print(f"\n📝 Contaminated memories: {len(points)} of {point_count}\n")
         
         # Track contamination keywords
         contamination_found = []
-        keywords = ['kenya', 'm-pesa', 'mpesa', 'epstein', 'maxwell', 'nyc', 'housing', 
-                   'roman', 'magistrate', 'inspector general']
         
         for i, point in enumerate(points, 1):
             payload = point.payload
             
             # Extract key info
-            message = payload.get('message', 'N/A')[:200]  # First 200 chars
+            message = payload.get('message', 'N/A')
             host = payload.get('host', 'N/A')
             exchange_num = payload.get('exchange_num', 'N/A')
             
-            # Check for contamination
-            message_lower = message.lower()
-            found_keywords = [k for k in keywords if k in message_lower]
-            
-            if found_keywords:
-                contamination_found.extend(found_keywords)
-                print(f"🚨 {i}. Exchange #{exchange_num} ({host}) - CONTAMINATION: {found_keywords}")
-            else:
-                print(f"✓ {i}. Exchange #{exchange_num} ({host})")
+            # Which keywords it mentions (reported in KEYWORDS order)
+            matched = {m.lower() for m in KEYWORD_PATTERN.findall(message)}
+            found_keywords = [k for k in KEYWORDS if k in matched]
             
-            print(f"   {message}...")
+            contamination_found.extend(found_keywords)
+            print(f"🚨 {i}. Exchange #{exchange_num} ({host}) - CONTAMINATION: {found_keywords}")
+            print(f"   {message[:200]}...")  # First 200 chars
             print()
         
         if contamination_found:
             print(f"⚠️  CONTAMINATION DETECTED: {set(contamination_found)}")
         else:
-            print("✅ No obvious contamination in sample")
+            print("✅ No contamination found")
             
     except Exception as e:
         print(f"❌ Error reading {collection_name}: {e}")
@@ -3,8 +3,6 @@ Research interns for ┴ROOF Radio
 Taco and Clunt fetch live web context to keep hosts grounded
 """
 
-import requests
-from bs4 import BeautifulSoup
 import time
 import random
 from ddgs import DDGS
@@ -50,7 +48,7 @@ class Intern:
             # Use DuckDuckGo search
             with DDGS() as ddgs:
                 # Search for the topic
-                results = list(ddgs.text(topic, max_results=5))
+                results = list(ddgs.text(topic, max_results=3))  # Only the top 3 are used
                 
                 if results:
                     # Extract key information from top results
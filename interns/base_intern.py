@@ -3,13 +3,29 @@ Base Intern class for ┴ROOF Radio
 All interns inherit from this and implement research flows
 """
 
+import bisect
+import threading
 import time
 from pathlib import Path
 from datetime import datetime
 import json
 
+import numpy as np
+
+from log_writer import get_log_writer
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 class BaseIntern:
+    # Search results are reused for near-identical queries within this window
+    SEARCH_CACHE_TTL = 900  # seconds
+    SEARCH_CACHE_THRESHOLD = 0.9  # cosine similarity between query embeddings
+    
     def __init__(self, name, model, role, style, logs_dir="logs/interns"):
         self.name = name
         self.model = model
@@ -21,13 +37,29 @@ class BaseIntern:
         self.general_log_dir = self.logs_dir / "general"
         self.general_log_dir.mkdir(parents=True, exist_ok=True)
         
-        # Track research history
+        # Daily log file, recomputed only when the date rolls over; the
+        # log writer swaps the open file when the source's path changes
+        self._log_day = None
+        self._log_file = None
+        self._log_source = self.general_log_dir / self.name.lower()
+        
+        # Track research history (researched_topics holds lowercased topics)
         self.researched_topics = set()
         self.research_history = []
         
+        # Embedding-indexed search cache (enabled when a subclass sets embed_fn):
+        # normalized query vectors stacked in one matrix, oldest first
+        self.embed_fn = None
+        self._cache_vecs = None
+        self._cache_results = []
+        self._cache_exp = []
+        # Research prefetch runs on a worker thread alongside the main loop
+        self._cache_lock = threading.Lock()
+        
     def log(self, event_type, message, data=None):
         """Log intern activity with full transparency"""
-        timestamp = datetime.now().isoformat()
+        now = datetime.now()
+        timestamp = now.isoformat()
         
         log_entry = {
             "timestamp": timestamp,
@@ -39,15 +71,81 @@ class BaseIntern:
         if data:
             log_entry["data"] = data
         
-        # Write to daily log file
-        log_file = self.general_log_dir / f"{self.name.lower()}_{datetime.now().strftime('%Y-%m-%d')}.log"
-        with open(log_file, 'a') as f:
-            f.write(f"[{timestamp}] {event_type}: {message}\n")
-            if data:
-                f.write(f"  DATA: {json.dumps(data, indent=2)}\n")
+        # Queue for the daily log file (written by the background log writer)
+        day = now.date()
+        if day != self._log_day:
+            self._log_day = day
+            self._log_file = self.general_log_dir / f"{self.name.lower()}_{day.isoformat()}.log"
+        
+        line = f"[{timestamp}] {event_type}: {message}\n"
+        if data:
+            if ORJSON_AVAILABLE:
+                payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+            else:
+                payload = json.dumps(data, indent=2)
+            line += f"  DATA: {payload}\n"
+        get_log_writer().write(self._log_file, line, self._log_source)
         
         return log_entry
     
+    def lookup_search(self, query):
+        """
+        Find unexpired search results for query or a close paraphrase
+        
+        Returns:
+            Tuple of (results or None, query embedding). Pass the embedding
+            to store_search() on a miss so the query isn't embedded twice.
+        """
+        if not self.embed_fn:
+            return None, None
+        
+        try:
+            q = np.asarray(self.embed_fn(query), dtype=np.float32)
+        except Exception as e:
+            self.log("SEARCH_CACHE_ERROR", f"Embedding failed: {e}")
+            return None, None
+        norm = np.linalg.norm(q)
+        if norm == 0:
+            return None, None
+        q /= norm
+        
+        with self._cache_lock:
+            # TTL is fixed and entries are appended in time order, so expired ones form a prefix
+            expired = bisect.bisect_right(self._cache_exp, time.time())
+            if expired:
+                self._cache_vecs = self._cache_vecs[expired:]
+                del self._cache_results[:expired]
+                del self._cache_exp[:expired]
+            
+            hit = None
+            if self._cache_results and self._cache_vecs.shape[1] == q.shape[0]:
+                scores = self._cache_vecs @ q
+                best = int(scores.argmax())
+                if scores[best] >= self.SEARCH_CACHE_THRESHOLD:
+                    hit = self._cache_results[best], float(scores[best])
+        
+        if hit:
+            results, similarity = hit
+            self.log("SEARCH_CACHE_HIT", f"Reusing results for '{query}' (similarity {similarity:.2f})")
+            return results, q
+        
+        return None, q
+    
+    def store_search(self, query_vec, results):
+        """Cache search results under an embedding returned by lookup_search()"""
+        if query_vec is None:
+            return
+        
+        with self._cache_lock:
+            if self._cache_results and self._cache_vecs.shape[1] == query_vec.shape[0]:
+                self._cache_vecs = np.vstack([self._cache_vecs, query_vec])
+            else:
+                self._cache_vecs = query_vec[np.newaxis, :]
+                self._cache_results = []
+                self._cache_exp = []
+            self._cache_results.append(results)
+            self._cache_exp.append(time.time() + self.SEARCH_CACHE_TTL)
+    
     def has_researched(self, topic):
         """Check if this topic has already been researched"""
         return topic.lower() in self.researched_topics
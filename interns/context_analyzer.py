@@ -4,13 +4,46 @@ Helps interns understand WHAT is actually being discussed
 """
 
 import re
+from collections import OrderedDict
 from typing import List, Dict, Set
 
 
+# Runs of capitalized words (potential proper nouns)
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+
+# Targeted query templates by question type
+# Taco adds: latest, technology, innovation keywords
+_TACO_QUERY_TEMPLATES = {
+    "which": "best {entity} 2024 2025",
+    "what": "{entity} features specifications",
+    "how": "{entity} how it works technology",
+    "why": "{entity} benefits advantages",
+    "where": "{entity} market applications",
+    "when": "{entity} latest developments"
+}
+
+# Clunt adds: criticism, history, alternatives
+_CLUNT_QUERY_TEMPLATES = {
+    "which": "{entity} comparison alternatives",
+    "what": "{entity} overview history",
+    "how": "{entity} problems issues",
+    "why": "{entity} criticism drawbacks",
+    "where": "{entity} usage limitations",
+    "when": "{entity} history evolution"
+}
+
+
 class ContextAnalyzer:
+    # Entity lists remembered per (topic, conversation context)
+    ENTITY_CACHE_SIZE = 32
+    
     def __init__(self, intern):
         self.intern = intern
         
+        # LRU of extract_main_entities results; the same context is
+        # analyzed several times per turn
+        self._entity_cache = OrderedDict()
+        
         # Question templates for different aspects
         self.clarifying_questions = {
             "which": ["Which specific {topic}?", "Which type of {topic}?", "Which brand/model of {topic}?"],
@@ -29,6 +62,13 @@ class ContextAnalyzer:
         - "bill recyclers" → ["bill recyclers", "bills", "recyclers", "cash handling"]
         - "Glory Global Solutions" → ["Glory Global Solutions", "cash technology", "ATMs"]
         """
+        cache_key = (topic, conversation_context)
+        cached = self._entity_cache.get(cache_key)
+        if cached is not None:
+            self._entity_cache.move_to_end(cache_key)
+            self.intern.log("ENTITIES_EXTRACTED", f"Found entities: {cached}")
+            return list(cached)
+        
         entities = []
         
         # Start with the main topic
@@ -36,7 +76,7 @@ class ContextAnalyzer:
         
         # Extract key nouns from conversation (simple version)
         # Look for capitalized words (potential proper nouns)
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', conversation_context)
+        proper_nouns = _PROPER_NOUN_RE.findall(conversation_context)
         entities.extend(proper_nouns[:3])  # Top 3
         
         # Extract compound nouns from topic
@@ -45,17 +85,19 @@ class ContextAnalyzer:
             entities.append(words[0])  # First word
             entities.append(words[-1])  # Last word
         
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_entities = []
+        # Remove duplicates (case-insensitively) while preserving order and first casing
+        first_casing = {}
         for entity in entities:
-            entity_lower = entity.lower()
-            if entity_lower not in seen:
-                seen.add(entity_lower)
-                unique_entities.append(entity)
+            first_casing.setdefault(entity.lower(), entity)
+        
+        unique_entities = list(first_casing.values())[:5]  # Top 5 entities
+        
+        self._entity_cache[cache_key] = unique_entities
+        if len(self._entity_cache) > self.ENTITY_CACHE_SIZE:
+            self._entity_cache.popitem(last=False)
         
         self.intern.log("ENTITIES_EXTRACTED", f"Found entities: {unique_entities}")
-        return unique_entities[:5]  # Top 5 entities
+        return list(unique_entities)
     
     def identify_knowledge_gaps(self, topic: str, conversation_context: str, 
                                 researched_topics: Set[str]) -> List[Dict[str, str]]:
@@ -70,20 +112,24 @@ class ContextAnalyzer:
         entities = self.extract_main_entities(topic, conversation_context)
         main_entity = entities[0] if entities else topic
         
-        # Check each question type
+        # Check each question type (researched_topics holds lowercased queries,
+        # see BaseIntern.mark_researched)
+        main_entity_lower = main_entity.lower()
         for question_type, templates in self.clarifying_questions.items():
+            # Every template of a type shares one search query
+            search_query = f"{main_entity} {question_type}"
+            
+            # Skip if we've already researched this angle
+            if f"{main_entity_lower} {question_type}" in researched_topics:
+                continue
+            
             for template in templates:
-                query = template.format(topic=main_entity)
-                search_query = f"{main_entity} {question_type}"
-                
-                # Skip if we've already researched this angle
-                if search_query.lower() not in researched_topics:
-                    gaps.append({
-                        "question": query,
-                        "search_query": search_query,
-                        "question_type": question_type,
-                        "entity": main_entity
-                    })
+                gaps.append({
+                    "question": template.format(topic=main_entity),
+                    "search_query": search_query,
+                    "question_type": question_type,
+                    "entity": main_entity
+                })
         
         self.intern.log("GAPS_IDENTIFIED", f"Found {len(gaps)} knowledge gaps")
         return gaps
@@ -112,13 +158,18 @@ class ContextAnalyzer:
             # Late: Context and history
             priority = ["when", "where", "why"]
         
+        # First gap of each question type, indexed in one pass
+        first_by_type = {}
+        for gap in knowledge_gaps:
+            first_by_type.setdefault(gap["question_type"], gap)
+        
         # Find first gap matching priority
         for question_type in priority:
-            for gap in knowledge_gaps:
-                if gap["question_type"] == question_type:
-                    self.intern.log("ANGLE_PRIORITIZED", 
-                                   f"Selected {question_type} question: {gap['question']}")
-                    return gap
+            gap = first_by_type.get(question_type)
+            if gap:
+                self.intern.log("ANGLE_PRIORITIZED", 
+                               f"Selected {question_type} question: {gap['question']}")
+                return gap
         
         # Fallback: return first available
         return knowledge_gaps[0]
@@ -137,29 +188,10 @@ class ContextAnalyzer:
         # Base query
         base_query = gap["search_query"]
         
-        # Customize based on intern personality
-        if intern_personality == "Taco":
-            # Taco adds: latest, technology, innovation keywords
-            modifiers = {
-                "which": f"best {entity} 2024 2025",
-                "what": f"{entity} features specifications",
-                "how": f"{entity} how it works technology",
-                "why": f"{entity} benefits advantages",
-                "where": f"{entity} market applications",
-                "when": f"{entity} latest developments"
-            }
-        else:  # Clunt
-            # Clunt adds: criticism, history, alternatives
-            modifiers = {
-                "which": f"{entity} comparison alternatives",
-                "what": f"{entity} overview history",
-                "how": f"{entity} problems issues",
-                "why": f"{entity} criticism drawbacks",
-                "where": f"{entity} usage limitations",
-                "when": f"{entity} history evolution"
-            }
-        
-        targeted_query = modifiers.get(question_type, base_query)
+        # Customize based on intern personality (only the needed template is formatted)
+        templates = _TACO_QUERY_TEMPLATES if intern_personality == "Taco" else _CLUNT_QUERY_TEMPLATES
+        template = templates.get(question_type)
+        targeted_query = template.format(entity=entity) if template else base_query
         
         self.intern.log("QUERY_GENERATED", f"Targeted query: {targeted_query}")
         return targeted_query
@@ -9,9 +9,61 @@ Philosophy:
 - Make it actionable
 """
 
+import heapq
 import re
 
 
+# One pass per category: alternatives are named groups, dispatched on m.lastgroup.
+# A match is consumed once, so "$2 billion" is a dollar amount only (not also a
+# bare large number) and "March 2024" a month-year only (not also a bare year).
+
+# Statistics
+_STATS_RE = re.compile(
+    r'(?P<usd>\$\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:million|billion|thousand|trillion))?)'
+    r'|(?P<pct>\b\d+(?:\.\d+)?%)'
+    r'|(?P<large>\b\d+(?:,\d{3})*(?:\.\d+)?\s*(?:million|billion|thousand|trillion))',
+    re.IGNORECASE)
+
+# Dates
+_DATES_RE = re.compile(
+    r'(?P<month_year>\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+20[12]\d\b)'
+    r'|(?P<year>\b20[12]\d\b)',
+    re.IGNORECASE)
+
+# Source attributions (only the expert pattern is case-sensitive)
+_SOURCES_RE = re.compile(
+    r'(?i:according to )(?P<according>[^,\.]+)'
+    r'|(?i:(?:study|research|report|survey|analysis)\s+(?:by|from)\s+)(?P<study>[^,\.]+)'
+    r'|(?P<expert>[A-Z][a-z]+\s+[A-Z][a-z]+),\s+(?i:a|an|the)\s+(?i:professor|researcher|expert|analyst|CEO|director)')
+
+# Matches kept per extractor; a bucket never needs more than this, and once
+# the top-ranked bucket is full the rest of the text can't change the result
+_MAX_STATS = 5
+_MAX_DATES = 3
+_MAX_SOURCES = 2
+
+# Shortest text any source pattern can match ("study by A")
+_MIN_SOURCE_LEN = 10
+
+# Source names
+_DOMAIN_RE = re.compile(r'https?://(?:www\.)?([^/]+)')
+_TLD_RE = re.compile(r'\.(com|org|net|edu|gov|io|co\.uk)$', re.IGNORECASE)
+
+# Key fact scoring
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+_NUM_RE = re.compile(r'\d+')
+
+# All scoring features in one pass. year comes before num so a year is not
+# consumed as a bare number; a year also counts as a number.
+_FACT_FEATURES_RE = re.compile(
+    r'(?P<year>\b20[12]\d\b)'
+    r'|(?P<num>\d+)'
+    r'|(?P<attr>according to|study|research|report)'
+    r'|(?P<sup>\b(?:first|largest|biggest|best|most|top|leading)\b)',
+    re.IGNORECASE)
+_FACT_WEIGHTS = {"num": 2, "year": 2, "attr": 3, "sup": 1}
+
+
 def digest_web_results(results, max_findings=3):
     """
     Enhanced digest that extracts actual useful information
@@ -53,14 +105,18 @@ def _extract_key_information(title, snippet, url):
     
     Returns enriched finding dict
     """
-    # Extract statistics (percentages, large numbers)
-    stats = _extract_statistics(snippet)
-    
-    # Extract dates/years
-    dates = _extract_dates(snippet)
+    # Every statistic and date pattern needs a digit - skip both scans without one
+    if _NUM_RE.search(snippet):
+        # Extract statistics (percentages, large numbers)
+        stats = _extract_statistics(snippet)
+        
+        # Extract dates/years
+        dates = _extract_dates(snippet)
+    else:
+        stats, dates = [], []
     
     # Extract proper nouns (potential sources/experts)
-    sources = _extract_sources(title, snippet)
+    sources = _extract_sources(title, snippet) if len(snippet) >= _MIN_SOURCE_LEN else []
     
     # Build enriched snippet
     enriched_snippet = snippet[:200]
@@ -91,65 +147,57 @@ def _extract_key_information(title, snippet, url):
 
 def _extract_statistics(text):
     """Extract percentages and numerical statistics from text"""
-    stats = []
-    
-    # Find percentages
-    percentages = re.findall(r'\b\d+(?:\.\d+)?%', text)
-    stats.extend(percentages)
-    
-    # Find large numbers with context (millions, billions, thousands)
-    large_numbers = re.findall(r'\b\d+(?:,\d{3})*(?:\.\d+)?\s*(?:million|billion|thousand|trillion)', text, re.IGNORECASE)
-    stats.extend(large_numbers)
-    
-    # Find dollar amounts
-    dollar_amounts = re.findall(r'\$\d+(?:,\d{3})*(?:\.\d+)?(?:\s*(?:million|billion|thousand|trillion))?', text, re.IGNORECASE)
-    stats.extend(dollar_amounts)
-    
-    return stats[:5]  # Top 5 stats
+    found = {"pct": [], "large": [], "usd": []}
+    for m in _STATS_RE.finditer(text):
+        bucket = found[m.lastgroup]
+        if len(bucket) < _MAX_STATS:
+            bucket.append(m.group())
+            if len(found["pct"]) == _MAX_STATS:
+                break
+    
+    # Percentages first, then large numbers (millions, billions...), then dollar amounts
+    stats = found["pct"] + found["large"] + found["usd"]
+    return stats[:_MAX_STATS]  # Top 5 stats
 
 
 def _extract_dates(text):
     """Extract years and dates from text"""
-    dates = []
-    
-    # Find 4-digit years (2020-2030)
-    years = re.findall(r'\b20[12]\d\b', text)
-    dates.extend(years)
-    
-    # Find month-year combinations
-    month_years = re.findall(r'\b(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+20[12]\d\b', text, re.IGNORECASE)
-    dates.extend(month_years)
-    
-    return dates[:3]  # Top 3 dates
+    found = {"year": [], "month_year": []}
+    for m in _DATES_RE.finditer(text):
+        bucket = found[m.lastgroup]
+        if len(bucket) < _MAX_DATES:
+            bucket.append(m.group())
+            if len(found["year"]) == _MAX_DATES:
+                break
+    
+    # 4-digit years (2010-2029), then month-year combinations
+    dates = found["year"] + found["month_year"]
+    return dates[:_MAX_DATES]  # Top 3 dates
 
 
 def _extract_sources(title, snippet):
     """Extract potential source attributions (experts, organizations, studies)"""
-    sources = []
-    
-    # Look for "according to X"
-    according_to = re.findall(r'according to ([^,\.]+)', snippet, re.IGNORECASE)
-    sources.extend(according_to)
-    
-    # Look for study/research mentions
-    studies = re.findall(r'(?:study|research|report|survey|analysis)\s+(?:by|from)\s+([^,\.]+)', snippet, re.IGNORECASE)
-    sources.extend(studies)
-    
-    # Look for expert quotes
-    experts = re.findall(r'([A-Z][a-z]+\s+[A-Z][a-z]+),\s+(?:a|an|the)\s+(?:professor|researcher|expert|analyst|CEO|director)', snippet)
-    sources.extend(experts)
-    
-    return sources[:2]  # Top 2 sources
+    found = {"according": [], "study": [], "expert": []}
+    for m in _SOURCES_RE.finditer(snippet):
+        bucket = found[m.lastgroup]
+        if len(bucket) < _MAX_SOURCES:
+            bucket.append(m.group(m.lastgroup))
+            if len(found["according"]) == _MAX_SOURCES:
+                break
+    
+    # "according to X", then study/research mentions, then expert quotes
+    sources = found["according"] + found["study"] + found["expert"]
+    return sources[:_MAX_SOURCES]  # Top 2 sources
 
 
 def _extract_source_name(url, title):
     """Extract clean source name from URL or title"""
     # Try to get domain name
-    domain_match = re.search(r'https?://(?:www\.)?([^/]+)', url)
+    domain_match = _DOMAIN_RE.search(url)
     if domain_match:
         domain = domain_match.group(1)
         # Clean up domain (remove .com, .org, etc)
-        clean_domain = re.sub(r'\.(com|org|net|edu|gov|io|co\.uk)$', '', domain, flags=re.IGNORECASE)
+        clean_domain = _TLD_RE.sub('', domain)
         # Capitalize first letter of each word
         return clean_domain.replace('-', ' ').replace('_', ' ').title()
     
@@ -235,7 +283,7 @@ def extract_key_facts(text, max_facts=3):
     facts = []
     
     # Split into sentences
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENT_SPLIT_RE.split(text)
     
     # Prioritize sentences with:
     # - Numbers/statistics
@@ -249,28 +297,19 @@ def extract_key_facts(text, max_facts=3):
         if len(sentence) < 20:  # Skip very short fragments
             continue
         
-        score = 0
-        
-        # Has numbers?
-        if re.search(r'\d+', sentence):
-            score += 2
-        
-        # Has dates?
-        if re.search(r'\b20[12]\d\b', sentence):
-            score += 2
-        
-        # Has attribution?
-        if re.search(r'according to|study|research|report', sentence, re.IGNORECASE):
-            score += 3
-        
-        # Has superlatives?
-        if re.search(r'\b(?:first|largest|biggest|best|most|top|leading)\b', sentence, re.IGNORECASE):
-            score += 1
+        # Numbers (+2), dates (+2), attribution (+3), superlatives (+1),
+        # each counted once however often it appears
+        features = {m.lastgroup for m in _FACT_FEATURES_RE.finditer(sentence)}
+        if "year" in features:
+            features.add("num")
+        score = sum(_FACT_WEIGHTS[f] for f in features)
         
-        scored_sentences.append((score, sentence))
+        # Sentences with no features can never be picked
+        if score > 0:
+            scored_sentences.append((score, sentence))
     
-    # Sort by score and take top facts
-    scored_sentences.sort(key=lambda x: x[0], reverse=True)
-    facts = [sent for score, sent in scored_sentences[:max_facts] if score > 0]
+    # Take top facts by score (ties keep text order, like a stable sort)
+    top = heapq.nlargest(max_facts, scored_sentences, key=lambda x: x[0])
+    facts = [sent for score, sent in top]
     
     return facts
@@ -3,18 +3,45 @@ Log Cleanup Utility for ┴ROOF Radio
 Removes old broadcast logs, keeps only current session
 """
 
+import os
 import shutil
 from pathlib import Path
 from datetime import datetime
 
 
+def _remove_files(dir_path, suffix=""):
+    """
+    Unlink the files directly inside dir_path whose names end with suffix
+    
+    os.scandir answers is_file() from the directory entry itself, so there
+    is no extra stat call per file.
+    
+    Returns:
+        Names of removed files
+    """
+    removed = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if entry.name.endswith(suffix) and entry.is_file():
+                os.unlink(entry.path)
+                removed.append(entry.name)
+    return removed
+
+
+def _count_files(dir_path):
+    """Number of files directly inside dir_path"""
+    with os.scandir(dir_path) as entries:
+        return sum(1 for entry in entries if entry.is_file())
+
+
 def clean_logs(logs_dir="logs", keep_structure=True):
     """
     Clean all old logs from previous broadcasts
     
     Args:
         logs_dir: Path to logs directory
-        keep_structure: If True, keeps directory structure but removes files
+        keep_structure: If True, keeps directory structure but removes files;
+            if False, deletes the log subdirectories outright
     
     Returns:
         Number of files removed
@@ -27,10 +54,9 @@ def clean_logs(logs_dir="logs", keep_structure=True):
     files_removed = 0
     
     # Remove all JSON conversation files in root logs/
-    for json_file in logs_path.glob("*.json"):
-        json_file.unlink()
+    for name in _remove_files(logs_path, ".json"):
         files_removed += 1
-        print(f"Removed old conversation: {json_file.name}")
+        print(f"Removed old conversation: {name}")
     
     # Clean subdirectories
     subdirs = ["debug", "hosts/general", "interns/general"]
@@ -39,10 +65,12 @@ def clean_logs(logs_dir="logs", keep_structure=True):
         subdir_path = logs_path / subdir
         
         if subdir_path.exists():
-            for log_file in subdir_path.glob("*"):
-                if log_file.is_file():
-                    log_file.unlink()
-                    files_removed += 1
+            if keep_structure:
+                files_removed += len(_remove_files(subdir_path))
+            else:
+                # Memory, hosts and interns recreate their log folders on startup
+                files_removed += _count_files(subdir_path)
+                shutil.rmtree(subdir_path)
     
     if files_removed > 0:
         print(f"\n🧹 Cleaned {files_removed} old log files")
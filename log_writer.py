@@ -0,0 +1,103 @@
+"""
+Shared background log writer for ┴ROOF Radio
+Hosts and interns enqueue log lines; one daemon thread appends them
+"""
+
+import atexit
+import queue
+import threading
+
+
+class LogWriter:
+    """
+    Background appender for host and intern log files
+    
+    Callers only enqueue lines; a daemon thread keeps each file open,
+    writes whatever has queued up in one batch per file, then flushes.
+    Each source (one host's or intern's log) keeps one open file: when it
+    moves to a new path, such as the next day's log, the old one is closed.
+    The queue is a SimpleQueue, so a put never waits on a lock.
+    """
+    
+    def __init__(self):
+        self._queue = queue.SimpleQueue()
+        self._handles = {}  # source -> (path, open file)
+        self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+    
+    def write(self, path, text, source=None):
+        """Queue text to be appended to path (source defaults to the path itself)"""
+        self._queue.put((path if source is None else source, path, text))
+    
+    def flush(self, timeout=5):
+        """Block until every line queued so far has been written"""
+        if self._thread.is_alive():
+            written = threading.Event()
+            self._queue.put(written)
+            written.wait(timeout)
+    
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            
+            # Drain everything already queued so it goes out in one pass
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            stop = False
+            flushed = []
+            by_path = {}  # path -> (source, lines)
+            for item in batch:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    flushed.append(item)
+                else:
+                    source, path, text = item
+                    by_path.setdefault(path, (source, []))[1].append(text)
+            
+            for path, (source, lines) in by_path.items():
+                try:
+                    open_path, handle = self._handles.get(source, (None, None))
+                    if open_path != path:
+                        if handle is not None:
+                            handle.close()
+                            del self._handles[source]
+                        handle = open(path, 'a')
+                        self._handles[source] = (path, handle)
+                    handle.writelines(lines)
+                    handle.flush()
+                except OSError as e:
+                    print(f"[⚠️  Log write failed for {path}: {e}]")
+            
+            for written in flushed:
+                written.set()
+            
+            if stop:
+                for _, handle in self._handles.values():
+                    handle.close()
+                self._handles.clear()
+                return
+    
+    def close(self):
+        """Write out queued lines and close all files"""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join(timeout=5)
+
+
+_log_writer = None
+_log_writer_lock = threading.Lock()
+
+
+def get_log_writer():
+    """Shared log writer, started on first use"""
+    global _log_writer
+    with _log_writer_lock:
+        if _log_writer is None:
+            _log_writer = LogWriter()
+        return _log_writer
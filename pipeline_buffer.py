@@ -23,13 +23,14 @@ class PipelineBuffer:
         # Buffer for completed responses
         self.response_queue = queue.Queue(maxsize=2)
         
-        # Pipeline state
+        # Pipeline state: one long-lived worker runs jobs one at a time
         self.pipeline_active = False
         self.pipeline_thread = None
         
-        # Current pipeline task
+        # Pending pipeline job (at most one waits - newer jobs replace it)
         self.current_task = None
         self.task_lock = threading.Lock()
+        self.task_queue = queue.Queue()
         
         # Metrics
         self.total_buffered = 0
@@ -38,11 +39,15 @@ class PipelineBuffer:
         
         print("[Pipeline Buffer initialized]")
     
-    def start_pipeline(self, next_intern, next_host, topic, current_message, conversation_summary):
+    def start_pipeline(self, next_intern, next_host, topic, current_message, conversation_summary,
+                       research_future=None):
         """
         Start pipeline for next response while current TTS plays
         
-        This runs in the background during TTS playback
+        This runs in the background during TTS playback, on a single
+        reused worker thread. If the worker is still busy with an earlier
+        job, a job that has not started yet is replaced by this one, so
+        the pipeline never runs more than one exchange ahead.
         
         Args:
             next_intern: Intern who will research
@@ -50,55 +55,90 @@ class PipelineBuffer:
             topic: Current topic
             current_message: What current host just said
             conversation_summary: Context
+            research_future: Optional Future already producing next_intern's
+                research brief for this topic (skips the research step)
         """
+        job = (next_intern, next_host, topic, current_message, conversation_summary, research_future)
         
-        def pipeline_worker():
-            """Background worker that executes the full pipeline"""
+        with self.task_lock:
+            # Drop a stale job that never started
+            while True:
+                try:
+                    self.task_queue.get_nowait()
+                    print("[Pipeline: Replacing stale queued job]", flush=True)
+                except queue.Empty:
+                    break
+            self.task_queue.put(job)
             
-            print(f"[Pipeline: Starting background generation for {next_host.name}]", flush=True)
-            start_time = time.time()
+            # Start the worker on first use
+            if self.pipeline_thread is None:
+                self.pipeline_thread = threading.Thread(target=self._pipeline_loop, daemon=True)
+                self.pipeline_thread.start()
+    
+    def _pipeline_loop(self):
+        """Worker thread: run queued pipeline jobs one at a time"""
+        while True:
+            job = self.task_queue.get()
+            
+            with self.task_lock:
+                self.current_task = job
+                self.pipeline_active = True
             
             try:
-                # Step 1: Intern research (happens immediately)
+                self._run_pipeline(*job)
+            finally:
+                with self.task_lock:
+                    self.current_task = None
+                    self.pipeline_active = False
+    
+    def _run_pipeline(self, next_intern, next_host, topic, current_message, conversation_summary,
+                      research_future=None):
+        """Execute the full pipeline: research, generate, buffer"""
+        
+        print(f"[Pipeline: Starting background generation for {next_host.name}]", flush=True)
+        start_time = time.time()
+        
+        try:
+            # Step 1: Intern research (happens immediately, unless already under way)
+            if research_future:
+                print(f"[Pipeline: Waiting on {next_intern.name}'s prefetched research...]", flush=True)
+                research = research_future.result()
+            else:
                 print(f"[Pipeline: {next_intern.name} researching...]", flush=True)
                 research = next_intern.research(topic, conversation_summary)
-                research_time = time.time() - start_time
-                print(f"[Pipeline: Research complete in {research_time:.1f}s]", flush=True)
-                
-                # Step 2: Host generation (happens while TTS still playing)
-                print(f"[Pipeline: {next_host.name} generating...]", flush=True)
-                response = next_host.speak(
-                    topic=topic,
-                    research_brief=research,
-                    other_host_message=current_message,
-                    conversation_summary=conversation_summary
-                )
-                generation_time = time.time() - start_time
-                print(f"[Pipeline: Generation complete in {generation_time:.1f}s]", flush=True)
-                
-                # Step 3: Queue the complete package
-                buffered_item = {
-                    "host": next_host,
-                    "message": response,
-                    "research": research,
-                    "generated_at": datetime.now().isoformat(),
-                    "pipeline_time": generation_time
-                }
-                
-                self.response_queue.put(buffered_item, block=False)
-                self.total_buffered += 1
-                
-                total_time = time.time() - start_time
-                print(f"[Pipeline: ✓ Response buffered in {total_time:.1f}s]", flush=True)
-                
-            except queue.Full:
-                print(f"[Pipeline: Buffer full, discarding]", flush=True)
-            except Exception as e:
-                print(f"[Pipeline: Error - {e}]", flush=True)
-        
-        # Start pipeline in background thread
-        self.pipeline_thread = threading.Thread(target=pipeline_worker, daemon=True)
-        self.pipeline_thread.start()
+            research_time = time.time() - start_time
+            print(f"[Pipeline: Research complete in {research_time:.1f}s]", flush=True)
+            
+            # Step 2: Host generation (happens while TTS still playing)
+            print(f"[Pipeline: {next_host.name} generating...]", flush=True)
+            response = next_host.speak(
+                topic=topic,
+                research_brief=research,
+                other_host_message=current_message,
+                conversation_summary=conversation_summary
+            )
+            generation_time = time.time() - start_time
+            print(f"[Pipeline: Generation complete in {generation_time:.1f}s]", flush=True)
+            
+            # Step 3: Queue the complete package
+            buffered_item = {
+                "host": next_host,
+                "message": response,
+                "research": research,
+                "generated_at": datetime.now().isoformat(),
+                "pipeline_time": generation_time
+            }
+            
+            self.response_queue.put(buffered_item, block=False)
+            self.total_buffered += 1
+            
+            total_time = time.time() - start_time
+            print(f"[Pipeline: ✓ Response buffered in {total_time:.1f}s]", flush=True)
+            
+        except queue.Full:
+            print(f"[Pipeline: Buffer full, discarding]", flush=True)
+        except Exception as e:
+            print(f"[Pipeline: Error - {e}]", flush=True)
     
     def get_buffered_response(self, timeout=0.5):
         """
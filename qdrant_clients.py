@@ -0,0 +1,50 @@
+"""
+Process-wide Qdrant clients and embedding models for ┴ROOF Radio
+
+Opening a local Qdrant store loads its segments and takes a lock on the
+folder, and loading an embedding model takes hundreds of milliseconds.
+Both are opened once per process here and shared by every caller.
+"""
+
+import atexit
+import threading
+from pathlib import Path
+
+from qdrant_client import QdrantClient
+
+
+_clients = {}
+_models = {}
+_lock = threading.Lock()
+
+
+def get_qdrant(path):
+    """Shared local-mode QdrantClient for a storage path"""
+    key = str(Path(path).resolve())
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = QdrantClient(path=str(path))
+        return client
+
+
+def get_text_embedding(model_name="sentence-transformers/all-MiniLM-L6-v2"):
+    """Shared FastEmbed model, loaded on first use"""
+    with _lock:
+        model = _models.get(model_name)
+        if model is None:
+            from fastembed import TextEmbedding
+            model = _models[model_name] = TextEmbedding(model_name=model_name)
+        return model
+
+
+@atexit.register
+def close_all():
+    """Close every shared Qdrant client"""
+    with _lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _clients.clear()
@@ -35,6 +35,9 @@ class SmartIntern(BaseIntern):
             persist_dir=f"data/{name.lower()}_research"
         )
         
+        # Paraphrased queries reuse recent search results (BaseIntern search cache)
+        self.embed_fn = self.research_memory._generate_embedding
+        
         # Initialize flows
         self.research_flow = ResearchFlow(self)
         self.fact_check_flow = FactCheckFlow(self)
@@ -172,11 +175,17 @@ class SmartIntern(BaseIntern):
             self.log("MEMORY_STORE_ERROR", f"Failed to store findings: {e}")
     
     def _web_search(self, query):
-        """Execute DuckDuckGo search"""
+        """Execute DuckDuckGo search (served from the search cache when possible)"""
+        cached, query_vec = self.lookup_search(query)
+        if cached is not None:
+            return cached
+        
         try:
             with DDGS() as search:
                 results = list(search.text(query, max_results=5))
                 self.log("SEARCH_SUCCESS", f"Retrieved {len(results)} results for '{query}'")
+                if results:
+                    self.store_search(query_vec, results)
                 return results
         except Exception as e:
             self.log("SEARCH_ERROR", f"Search failed: {str(e)}")
@@ -32,8 +32,7 @@ fi
 echo ""
 echo "4. Checking Python packages..."
 python3 -c "import ollama" 2>/dev/null && echo "   ✓ ollama package installed" || echo "   ✗ ollama package missing - run: pip install ollama"
-python3 -c "import requests" 2>/dev/null && echo "   ✓ requests package installed" || echo "   ✗ requests package missing - run: pip install -r requirements.txt"
-python3 -c "import bs4" 2>/dev/null && echo "   ✓ beautifulsoup4 package installed" || echo "   ✗ beautifulsoup4 package missing - run: pip install -r requirements.txt"
+python3 -c "import ddgs" 2>/dev/null && echo "   ✓ ddgs package installed" || echo "   ✗ ddgs package missing - run: pip install -r requirements.txt"
 
 echo ""
 echo "5. Testing import of ┴ROOF modules..."
@@ -5,6 +5,7 @@ Extracts interesting threads from conversation and evolves research organically
 
 import re
 from collections import deque
+from itertools import islice
 
 
 class TopicEvolver:
@@ -110,7 +111,8 @@ class TopicEvolver:
         # Mid conversation: Start extracting interesting concepts
         if self.current_depth <= 8:
             # Get last 2 host messages
-            recent_messages = host_messages[-2:] if len(host_messages) >= 2 else host_messages
+            # Works for lists or deques (no copy of the whole history)
+            recent_messages = list(islice(host_messages, max(0, len(host_messages) - 2), None))
             
             all_concepts = []
             for msg in recent_messages:
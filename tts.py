@@ -7,7 +7,10 @@ import subprocess
 import platform
 import os
 import asyncio
+import atexit
+import hashlib
 import tempfile
+import threading
 import re
 from pathlib import Path
 
@@ -25,6 +28,10 @@ class TTS:
         self.temp_dir = Path(tempfile.gettempdir()) / "troof_audio"
         self.temp_dir.mkdir(exist_ok=True)
         
+        # Pre-rendered clips for known lines: (speaker_name, text) -> audio file
+        self._audio_cache = {}
+        atexit.register(self._clear_audio_cache)
+        
         if not EDGE_TTS_AVAILABLE and voice_type == "edge":
             print("[Note: edge-tts not installed. Using text output only.]")
             print("[Install with: pip install edge-tts]")
@@ -44,11 +51,84 @@ class TTS:
         print(f"{border}\n")
         
         # If edge-tts is available, also speak it
-        if self.voice_type == "edge" and EDGE_TTS_AVAILABLE:
+        self._speak_audio(text, speaker_name)
+    
+    def _speak_audio(self, text, speaker_name):
+        """Play text aloud - from the pre-rendered cache when available"""
+        if self.voice_type != "edge" or not EDGE_TTS_AVAILABLE:
+            return
+        
+        cached = self._audio_cache.get((speaker_name, text))
+        if cached:
+            self._play_audio(cached)
+            return
+        
+        try:
+            asyncio.run(self._speak_edge_tts_async(text, speaker_name))
+        except Exception as e:
+            print(f"[Audio playback failed: {e}]")
+    
+    def prerender(self, lines):
+        """
+        Synthesize known lines in the background so they play instantly later
+        
+        Args:
+            lines: Iterable of (text, speaker_name) - e.g. filler lines
+                   hosts fall back to when generation fails
+        """
+        if self.voice_type != "edge" or not EDGE_TTS_AVAILABLE:
+            return
+        
+        lines = list(lines)
+        
+        def render_all():
+            for text, speaker_name in lines:
+                if (speaker_name, text) in self._audio_cache:
+                    continue
+                
+                voice = VOICE_MAP.get(speaker_name, {}).get("edge", "en-US-GuyNeural")
+                digest = hashlib.blake2b(f"{voice}|{text}".encode(), digest_size=8).hexdigest()
+                audio_file = self.temp_dir / f"cached_{digest}.mp3"
+                
+                try:
+                    asyncio.run(edge_tts.Communicate(text, voice).save(str(audio_file)))
+                    self._audio_cache[(speaker_name, text)] = audio_file
+                except Exception as e:
+                    print(f"[Pre-render failed for '{text[:40]}': {e}]")
+        
+        threading.Thread(target=render_all, daemon=True).start()
+    
+    def _clear_audio_cache(self):
+        """Remove pre-rendered clips"""
+        for audio_file in self._audio_cache.values():
             try:
-                asyncio.run(self._speak_edge_tts_async(text, speaker_name))
-            except Exception as e:
-                print(f"[Audio playback failed: {e}]")
+                audio_file.unlink()
+            except OSError:
+                pass
+        self._audio_cache.clear()
+    
+    def speak_stream(self, sentences, speaker_name):
+        """
+        Speak sentences as they arrive on a queue, until a None sentinel
+        
+        Used while a host is still generating: each sentence is printed
+        and played as soon as it is complete, instead of waiting for the
+        whole message.
+        """
+        border = "─" * 80
+        print(f"\n{border}")
+        print(f"🎙️  {speaker_name}")
+        print(f"{border}")
+        
+        while True:
+            sentence = sentences.get()
+            if sentence is None:
+                break
+            
+            print(sentence, flush=True)
+            self._speak_audio(sentence, speaker_name)
+        
+        print(f"{border}\n")
     
     async def _speak_edge_tts_async(self, text, speaker_name):
         """Use Edge TTS (async version for proper implementation)"""
@@ -3,11 +3,13 @@ Qdrant Vector Memory for ┴ROOF Radio with Botanical Integration
 Modern vector database with Python 3.14 support + Taraxacum & Trillium
 """
 
-from qdrant_client import QdrantClient
+import numpy as np
 from qdrant_client.models import Distance, VectorParams, PointStruct
 from datetime import datetime
 from pathlib import Path
 
+from qdrant_clients import get_qdrant, get_text_embedding
+
 # Import botanicals
 from botanicals.taraxacum import TaraxacumSeedSpreader, TaraxacumGerminator
 from botanicals.trillium import TrilliumRhizome, TrilliumThreePetals
@@ -57,8 +59,8 @@ class VectorConversationMemory:
         # Use host-specific subdirectory to prevent lock conflicts
         host_storage_path = self.persist_dir / f"qdrant_{host_name.lower()}"
         
-        # Initialize Qdrant client (local mode, persistent)
-        self.client = QdrantClient(path=str(host_storage_path))
+        # Qdrant client (local mode, persistent), shared per storage path
+        self.client = get_qdrant(host_storage_path)
         
         # Collection name
         self.collection_name = f"{host_name.lower()}_conversation"
@@ -82,9 +84,18 @@ class VectorConversationMemory:
         
         self.exchange_count = 0
         
+        # In-process search index mirroring the collection: L2-normalized
+        # vectors in one float32 matrix (first _index_count rows in use),
+        # with payloads in insertion order. Qdrant remains the persistence.
+        self._matrix = np.zeros((0, self.vector_size), dtype=np.float32)
+        self._index_count = 0
+        self._payloads = []
+        self._point_rows = {}  # point id -> matrix row
+        self._load_index()
+        
         # Initialize botanicals
-        self.taraxacum_spreader = TaraxacumSeedSpreader()
-        self.taraxacum_germinator = TaraxacumGerminator()
+        self.taraxacum_spreader = TaraxacumSeedSpreader(embed_fn=self._generate_embedding)
+        self.taraxacum_germinator = TaraxacumGerminator(embed_fn=self._generate_embedding)
         self.trillium_rhizome = TrilliumRhizome()
         self.trillium_petals = TrilliumThreePetals()
         
@@ -115,17 +126,13 @@ class VectorConversationMemory:
         
         Uses all-MiniLM-L6-v2 (384 dimensions, fast, accurate)
         """
-        from fastembed import TextEmbedding
-        
-        # Initialize embedding model (cached after first call)
-        if not hasattr(self, '_embedding_model'):
-            self._embedding_model = TextEmbedding(
-                model_name="sentence-transformers/all-MiniLM-L6-v2"
-            )
-        
-        # Generate embedding
-        embeddings = list(self._embedding_model.embed([text]))
-        return embeddings[0].tolist()
+        return self._generate_embeddings([text])[0]
+    
+    def _generate_embeddings(self, texts):
+        """Embed several texts in one batched FastEmbed pass"""
+        # One model instance shared by every memory in the process
+        model = get_text_embedding("sentence-transformers/all-MiniLM-L6-v2")
+        return [embedding.tolist() for embedding in model.embed(texts)]
     
     def _generate_id(self, text, exchange_num):
         """Generate unique UUID for this exchange"""
@@ -135,6 +142,72 @@ class VectorConversationMemory:
         unique_str = f"{self.host_name}_{exchange_num}_{text[:50]}"
         return str(uuid.uuid5(namespace, unique_str))
     
+    def _load_index(self):
+        """Fill the in-process index from points already stored in Qdrant"""
+        points = []
+        offset = None
+        while True:
+            batch, offset = self.client.scroll(
+                collection_name=self.collection_name,
+                limit=256,
+                offset=offset,
+                with_payload=True,
+                with_vectors=True
+            )
+            points.extend(batch)
+            if offset is None:
+                break
+        
+        # Oldest first, so insertion order doubles as recency
+        points.sort(key=lambda p: (p.payload.get("timestamp", ""), p.payload.get("exchange_num", 0)))
+        for point in points:
+            self._index_point(point.id, point.vector, point.payload)
+    
+    def _index_point(self, point_id, vector, payload):
+        """Add (or replace, for a re-upserted id) one point in the in-process index"""
+        vec = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        if norm > 0:
+            vec = vec / norm
+        
+        row = self._point_rows.get(point_id)
+        if row is not None:
+            self._matrix[row] = vec
+            self._payloads[row] = payload
+            return
+        
+        # Grow capacity in powers of two so appends stay amortized O(1)
+        if self._index_count == self._matrix.shape[0]:
+            grown = np.zeros((max(64, 2 * self._matrix.shape[0]), self.vector_size), dtype=np.float32)
+            grown[:self._index_count] = self._matrix[:self._index_count]
+            self._matrix = grown
+        
+        row = self._index_count
+        self._matrix[row] = vec
+        self._payloads.append(payload)
+        self._point_rows[point_id] = row
+        self._index_count += 1
+    
+    def _top_k(self, query_vector, k):
+        """(score, payload) pairs for the k most similar indexed points, best first"""
+        if self._index_count == 0 or k <= 0:
+            return []
+        
+        query = np.asarray(query_vector, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm > 0:
+            query = query / norm
+        
+        scores = self._matrix[:self._index_count] @ query
+        k = min(k, self._index_count)
+        if k < self._index_count:
+            top = np.argpartition(scores, -k)[-k:]
+        else:
+            top = np.arange(self._index_count)
+        top = top[np.argsort(-scores[top])]
+        
+        return [(float(scores[i]), self._payloads[i]) for i in top]
+    
     def _estimate_context_usage(self):
         """Estimate current context window usage"""
         # Rough estimate: ~4 chars per token
@@ -169,8 +242,11 @@ class VectorConversationMemory:
         if other_host_message:
             self.context_tokens_estimate += len(other_host_message) // 4
         
-        # Generate embedding for the message
-        message_vector = self._generate_embedding(message)
+        # Embed the message and the other host's line together in one batch
+        if other_host_message:
+            message_vector, other_vector = self._generate_embeddings([message, other_host_message])
+        else:
+            message_vector = self._generate_embedding(message)
         
         # Create metadata
         payload = {
@@ -199,11 +275,11 @@ class VectorConversationMemory:
                 )
             ]
         )
+        self._index_point(point_id, message_vector, payload)
         
         # Also store what other host said (for context)
         if other_host_message:
             other_name = "Homer" if self.host_name == "Goku" else "Goku"
-            other_vector = self._generate_embedding(other_host_message)
             
             other_payload = {
                 "exchange_num": self.exchange_count,
@@ -230,6 +306,7 @@ class VectorConversationMemory:
                     )
                 ]
             )
+            self._index_point(other_id, other_vector, other_payload)
         
         print(f"[Qdrant: Stored exchange #{self.exchange_count}]")
         
@@ -273,12 +350,15 @@ class VectorConversationMemory:
         report = self.taraxacum_spreader.prepare_for_death(conversation_state)
         print(f"[🌼 {self.host_name} scattered {report['seed_count']} seeds for next generation]")
     
-    def get_deep_wisdom(self, current_topic):
+    def get_deep_wisdom(self, current_topic, timeout=None):
         """
         TRILLIUM: Retrieve accumulated wisdom from rhizome
         
-        Returns themes and insights from all past conversations
+        Returns themes and insights from all past conversations.
+        With a timeout, returns empty context rather than blocking past it.
         """
+        if timeout is not None:
+            return self.trillium_rhizome.get_deep_context_within([current_topic], timeout)
         return self.trillium_rhizome.get_deep_context([current_topic])
     
     def verify_response_balance(self, response):
@@ -315,23 +395,20 @@ class VectorConversationMemory:
         # Generate query vector
         query_vector = self._generate_embedding(current_topic)
         
-        # Search Qdrant for similar exchanges
-        search_results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=query_vector,
-            limit=min(n_results * 2, self.exchange_count),
-            score_threshold=0.3
-        ).points
+        # Search the in-process index (one matrix-vector product)
+        search_results = self._top_k(query_vector, min(n_results * 2, self.exchange_count))
         
         # Format results
         relevant = []
-        for result in search_results[:n_results]:
+        for score, payload in search_results[:n_results]:
+            if score < 0.3:
+                break
             relevant.append({
-                "exchange_num": result.payload.get("exchange_num", 0),
-                "host": result.payload.get("host", "Unknown"),
-                "message": result.payload.get("message", ""),
-                "distance": 1.0 - result.score,
-                "similarity": result.score
+                "exchange_num": payload.get("exchange_num", 0),
+                "host": payload.get("host", "Unknown"),
+                "message": payload.get("message", ""),
+                "distance": 1.0 - score,
+                "similarity": score
             })
         
         if relevant:
@@ -347,32 +424,20 @@ class VectorConversationMemory:
         if self.exchange_count == 0:
             return []
         
-        # Scroll through all points
-        points, _ = self.client.scroll(
-            collection_name=self.collection_name,
-            limit=100,
-            with_payload=True,
-            with_vectors=False
-        )
-        
-        # Filter to only main exchanges
-        main_exchanges = [
-            p for p in points 
-            if p.payload.get("host") == self.host_name and "context_for" not in p.payload
-        ]
-        
-        # Sort by exchange number
-        main_exchanges.sort(key=lambda x: x.payload.get("exchange_num", 0), reverse=True)
-        
-        # Take most recent n_exchanges
-        recent = main_exchanges[:n_exchanges]
+        # Walk the index newest first, keeping only main exchanges
+        recent = []
+        for payload in reversed(self._payloads):
+            if len(recent) >= n_exchanges:
+                break
+            if payload.get("host") == self.host_name and "context_for" not in payload:
+                recent.append(payload)
         recent.reverse()  # Chronological order
         
         return [{
-            "exchange_num": ex.payload.get("exchange_num", 0),
-            "host": ex.payload.get("host", "Unknown"),
-            "message": ex.payload.get("message", ""),
-            "timestamp": ex.payload.get("timestamp", "")
+            "exchange_num": ex.get("exchange_num", 0),
+            "host": ex.get("host", "Unknown"),
+            "message": ex.get("message", ""),
+            "timestamp": ex.get("timestamp", "")
         } for ex in recent]
     
     def should_avoid_statement(self, potential_statement, similarity_threshold=0.85):
@@ -384,16 +449,12 @@ class VectorConversationMemory:
         query_vector = self._generate_embedding(potential_statement)
         
         # Search for similar statements
-        results = self.client.query_points(
-            collection_name=self.collection_name,
-            query=query_vector,
-            limit=3
-        ).points
+        results = self._top_k(query_vector, 3)
         
         # Check similarity
-        for result in results:
-            if result.score > similarity_threshold:
-                print(f"[Qdrant: Statement too similar ({result.score:.2%}) - avoiding]")
+        for score, _ in results:
+            if score > similarity_threshold:
+                print(f"[Qdrant: Statement too similar ({score:.2%}) - avoiding]")
                 return True
         
         return False
@@ -432,5 +493,8 @@ class VectorConversationMemory:
         
         self.exchange_count = 0
         self.context_tokens_estimate = 0
+        self._index_count = 0
+        self._payloads = []
+        self._point_rows = {}
         print(f"[Qdrant: Collection cleared for {self.host_name}]")
         print("[Note: Trillium rhizome and Taraxacum seeds persist across resets]")